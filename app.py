@@ -1,19 +1,20 @@
 """
 AI资讯采集系统 - Flask主应用
 """
-import asyncio
+import atexit
 import json
 import os
 import logging
 from datetime import datetime, date
 from flask import Flask, render_template, request, jsonify, send_file, send_from_directory
-from concurrent.futures import ThreadPoolExecutor
-import threading
 
 # 导入自定义模块
 from config import Config
-from scrapers.sohu_scraper import SohuScraper
+from async_service import AsyncLoopService
+from job_manager import JobManager
 from scrapers.aibase_news_scraper import AIBaseNewsScraper
+from scrapers.browser_pool import BrowserPool
+from scrapers.sources import crawl_sources, register_shared_clients
 from deepseek_api import DeepSeekAPI
 from webhook import KingsoftWebhook
 from poster_gen import PosterGenerator
@@ -38,23 +39,36 @@ app.config.from_object(Config)
 # 确保目录存在
 Config.ensure_dirs()
 
-# 全局变量
-current_task = None
-task_progress = {"status": "idle", "progress": 0, "message": "", "details": []}
+# 后台任务：每个任务独立的ID、状态、进度与结果，同时执行的任务数受 JOB_CONFIG 限制
+jobs = JobManager(
+    max_workers=Config.JOB_CONFIG.get('max_workers', 4),
+    history_limit=Config.JOB_CONFIG.get('history_limit', 100)
+)
 
-def run_async(coro):
-    """在新事件循环中运行异步任务"""
-    def run_in_thread():
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
+# 常驻后台事件循环：所有异步任务提交到同一个循环，长连接客户端在其上预热复用
+async_loop = AsyncLoopService(name='app-async-loop')
+register_shared_clients(async_loop)
+async_loop.register_client('deepseek', DeepSeekAPI, close=lambda api: api.close_session())
+async_loop.register_client('webhook', KingsoftWebhook, close=lambda webhook: webhook.close_session())
+async_loop.register_client(
+    'poster',
+    lambda: PosterGenerator(browser_pool=BrowserPool(
+        size=1,
+        launch_options={'headless': True, 'args': ['--no-sandbox', '--disable-dev-shm-usage']},
+        context_options={'device_scale_factor': 2}
+    )),
+    close=lambda generator: generator.close()
+)
+atexit.register(async_loop.stop)
+
+def start_aibase_follow():
+    """后台持续跟踪AIBase新快讯并写入索引，日报采集时目标日期的快讯已就绪"""
+    async def follow():
+        scraper = AIBaseNewsScraper(session=await async_loop.client('aibase_session'))
+        async for news in scraper.follow_news():
+            logger.info(f"AIBase新快讯: {news['id']} {news['title']}")
     
-    with ThreadPoolExecutor() as executor:
-        future = executor.submit(run_in_thread)
-        return future.result()
+    return async_loop.submit(follow())
 
 @app.route('/')
 def index():
@@ -119,6 +133,9 @@ def save_config():
                 # 重新加载配置到Config类
                 Config.DEEPSEEK_API_KEY = env_manager.get_value('DEEPSEEK_API_KEY', '')
                 Config.KINGSOFT_WEBHOOK_URL = env_manager.get_value('KINGSOFT_WEBHOOK_URL', '')
+                # 常驻客户端持有旧配置，丢弃后下次使用时按新配置重建
+                async_loop.run(async_loop.reset_client('deepseek'))
+                async_loop.run(async_loop.reset_client('webhook'))
                 
                 return jsonify({
                     'success': True, 
@@ -135,190 +152,154 @@ def save_config():
 
 @app.route('/api/test_connections', methods=['POST'])
 def test_connections():
-    """测试API连接"""
-    global task_progress
-    
-    try:
-        task_progress = {"status": "running", "progress": 0, "message": "正在测试连接...", "details": []}
-        
+    """测试API连接（登记为任务，在请求线程中直接执行并同步返回结果）"""
+    def connection_task(job):
         results = {}
         
         # 测试DeepSeek API
-        task_progress["message"] = "测试DeepSeek API连接..."
-        task_progress["progress"] = 25
+        job.update("测试DeepSeek API连接...", 25)
         
         try:
-            api = DeepSeekAPI()
-            deepseek_result = run_async(api.test_connection())
+            deepseek_result = async_loop.call('deepseek', 'test_connection')
             results['deepseek'] = deepseek_result
-            task_progress["details"].append(f"DeepSeek API: {'✅ 成功' if deepseek_result.get('success') else '❌ 失败'}")
+            job.add_details(f"DeepSeek API: {'✅ 成功' if deepseek_result.get('success') else '❌ 失败'}")
         except Exception as e:
             results['deepseek'] = {'success': False, 'error': str(e)}
-            task_progress["details"].append(f"DeepSeek API: ❌ 失败 - {str(e)}")
+            job.add_details(f"DeepSeek API: ❌ 失败 - {str(e)}")
         
         # 测试Webhook连接
-        task_progress["message"] = "测试Webhook连接..."
-        task_progress["progress"] = 50
+        job.update("测试Webhook连接...", 50)
         
         try:
-            webhook = KingsoftWebhook()
-            webhook_result = run_async(webhook.test_webhook())
+            webhook_result = async_loop.call('webhook', 'test_webhook')
             results['webhook'] = webhook_result
-            task_progress["details"].append(f"金山文档Webhook: {'✅ 成功' if webhook_result.get('success') else '❌ 失败'}")
+            job.add_details(f"金山文档Webhook: {'✅ 成功' if webhook_result.get('success') else '❌ 失败'}")
         except Exception as e:
             results['webhook'] = {'success': False, 'error': str(e)}
-            task_progress["details"].append(f"金山文档Webhook: ❌ 失败 - {str(e)}")
+            job.add_details(f"金山文档Webhook: ❌ 失败 - {str(e)}")
         
         # 测试爬虫连接
-        task_progress["message"] = "测试爬虫连接..."
-        task_progress["progress"] = 75
+        job.update("测试爬虫连接...", 75)
         
         # 简单的连接测试，不实际爬取
         results['scrapers'] = {'success': True, 'message': '爬虫模块加载正常'}
-        task_progress["details"].append("爬虫模块: ✅ 加载正常")
-        
-        task_progress["status"] = "completed"
-        task_progress["progress"] = 100
-        task_progress["message"] = "连接测试完成"
-        
-        return jsonify({
-            'success': True,
-            'results': results
-        })
-        
-    except Exception as e:
-        task_progress["status"] = "error"
-        task_progress["message"] = f"连接测试失败: {str(e)}"
+        job.add_details("爬虫模块: ✅ 加载正常")
         
+        job.update("连接测试完成")
+        return results
+    
+    # 不经过任务工作线程：采集任务占满工作线程时连接测试也不必排队
+    job = jobs.run('test_connections', connection_task)
+    if job.status == 'error':
         return jsonify({
             'success': False,
-            'error': str(e)
+            'job_id': job.id,
+            'error': job.error
         }), 500
+    
+    return jsonify({
+        'success': True,
+        'job_id': job.id,
+        'results': job.result
+    })
 
 @app.route('/api/crawl', methods=['POST'])
 def start_crawl():
-    """开始爬取任务"""
-    global current_task, task_progress
-    
-    if current_task and current_task.is_alive():
-        return jsonify({'success': False, 'error': '已有任务在运行中'}), 400
-    
+    """开始爬取任务，返回任务ID，进度通过 /api/jobs/<任务ID> 查询"""
     data = request.json
     target_date = data.get('date', date.today().strftime('%Y-%m-%d'))
     sources = data.get('sources', ['tencent', 'aibase'])
+    # 采集时间预算（秒）：到期取消未完成的工作，返回已获取的部分结果并标记为不完整
+    deadline = data.get('deadline', Config.CRAWLER_CONFIG.get('crawl_deadline'))
+    try:
+        deadline = float(deadline) if deadline not in (None, '') else None
+    except (TypeError, ValueError):
+        return jsonify({'success': False, 'error': f'无效的截止时间: {deadline}'}), 400
     
-    def crawl_task():
-        global task_progress
-        
-        # 在函数开头导入datetime相关模块
-        from datetime import datetime, timedelta
+    def crawl_task(job):
+        job.update("开始爬取任务...", 0, sources={}, partial=False)
+        lane_states = {}
+        
+        def on_lane_update(lane):
+            # 每个数据源一个进度通道；总进度取各通道完成比例的平均值（爬取阶段占 0~80%）
+            lane_states[lane.key] = lane.to_dict()
+            lanes = list(lane_states.values())
+            done = sum(1.0 if l["status"] in ('completed', 'error')
+                       else (l["current"] / l["total"] if l["total"] else 0.0) for l in lanes)
+            running = [l["message"] for l in lanes if l["status"] == 'running' and l["message"]]
+            job.update(" | ".join(running) if running else None, int(80 * done / len(lanes)),
+                       sources=dict(lane_states))
+        
+        # 所有选中的数据源在同一个事件循环上并发爬取，总耗时约为最慢数据源的耗时
+        all_articles, lanes = async_loop.run(crawl_sources(sources, target_date, on_update=on_lane_update,
+                                                           deadline=deadline, clients=async_loop))
+        for lane in lanes.values():
+            job.add_details(*lane.details)
+        partial = any(lane.partial for lane in lanes.values())
+        
+        job.update("爬取完成，正在保存缓存...", 80, partial=partial)
+        
+        # 保存到缓存
+        cache_file = os.path.join(Config.CACHE_DIR, f"articles_{target_date.replace('-', '')}.json")
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'date': target_date,
+                'articles': all_articles,
+                'timestamp': datetime.now().isoformat(),
+                'total': len(all_articles),
+                'partial': partial
+            }, f, ensure_ascii=False, indent=2)
+        
+        if partial:
+            job.update(f"已到截止时间，返回部分结果：共获取 {len(all_articles)} 篇文章")
+        else:
+            job.update(f"爬取完成！共获取 {len(all_articles)} 篇文章")
         
-        try:
-            task_progress = {
-                "status": "running", 
-                "progress": 0, 
-                "message": "开始爬取任务...", 
-                "details": [],
-                "articles": []
-            }
-            
-            all_articles = []
-            
-            # 爬取腾讯研究院
-            if 'tencent' in sources:
-                task_progress["message"] = "正在爬取腾讯研究院AI速递..."
-                task_progress["progress"] = 20
-                
-                try:
-                    scraper = SohuScraper()
-                    target_date_obj = datetime.strptime(target_date, '%Y-%m-%d').date()
-                    articles, errors = run_async(scraper.scrape_articles(target_date_obj, target_date_obj))
-                    
-                    all_articles.extend([article.to_dict() for article in articles])
-                    task_progress["details"].append(f"腾讯研究院: 成功获取 {len(articles)} 篇文章")
-                    
-                    if errors:
-                        task_progress["details"].extend([f"腾讯研究院错误: {error}" for error in errors[:3]])
-                        
-                except Exception as e:
-                    task_progress["details"].append(f"腾讯研究院爬取失败: {str(e)}")
-            
-            # 爬取AIBase快讯
-            if 'aibase' in sources:
-                task_progress["message"] = "正在爬取AIBase快讯..."
-                task_progress["progress"] = 50
-                
-                try:
-                    scraper = AIBaseNewsScraper()
-                    # AIBase采集前一天的数据（因为AIBase当天快讯对应前一天信息）
-                    target_date_obj = datetime.strptime(target_date, '%Y-%m-%d')
-                    aibase_date = (target_date_obj - timedelta(days=1)).strftime('%Y-%m-%d')
-                    task_progress["details"].append(f"AIBase采集日期: {aibase_date} (前一天，因为AIBase快讯时效对应前一天信息)")
-                    
-                    news_list = run_async(scraper.get_news_by_date(aibase_date))
-                    
-                    # 转换为Article格式
-                    for news in news_list:
-                        article_dict = {
-                            'title': news.get('title', ''),
-                            'date': news.get('date', target_date),
-                            'content': news.get('content', news.get('summary', '')),
-                            'url': news.get('url', ''),
-                            'source': news.get('source', 'AIBase快讯'),
-                            'weight': news.get('weight', 5)
-                        }
-                        all_articles.append(article_dict)
-                    
-                    task_progress["details"].append(f"AIBase快讯: 成功获取 {len(news_list)} 条快讯")
-                    
-                except Exception as e:
-                    task_progress["details"].append(f"AIBase快讯爬取失败: {str(e)}")
-            
-            task_progress["message"] = "爬取完成，正在保存缓存..."
-            task_progress["progress"] = 80
-            task_progress["articles"] = all_articles
-            
-            # 保存到缓存
-            cache_file = os.path.join(Config.CACHE_DIR, f"articles_{target_date.replace('-', '')}.json")
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'date': target_date,
-                    'articles': all_articles,
-                    'timestamp': datetime.now().isoformat(),
-                    'total': len(all_articles)
-                }, f, ensure_ascii=False, indent=2)
-            
-            task_progress["status"] = "completed"
-            task_progress["progress"] = 100
-            task_progress["message"] = f"爬取完成！共获取 {len(all_articles)} 篇文章"
-            
-            logger.info(f"爬取任务完成: {target_date}, 共 {len(all_articles)} 篇文章")
-            
-        except Exception as e:
-            task_progress["status"] = "error"
-            task_progress["message"] = f"爬取任务失败: {str(e)}"
-            logger.error(f"爬取任务失败: {e}")
+        logger.info(f"爬取任务完成: {target_date}, 共 {len(all_articles)} 篇文章")
+        return {
+            'articles': all_articles,
+            'total': len(all_articles),
+            'partial': partial
+        }
     
-    current_task = threading.Thread(target=crawl_task)
-    current_task.start()
+    # 不同日期可以并行采集；同一日期同时只运行一个任务，避免重复写同一个缓存文件
+    job, created = jobs.submit_unique('crawl', crawl_task,
+                                      {'date': target_date, 'sources': sources, 'deadline': deadline},
+                                      unique_keys=['date'])
+    if not created:
+        return jsonify({'success': False, 'error': f'{target_date} 已有采集任务在运行中', 'job_id': job.id}), 400
     
-    return jsonify({'success': True, 'message': '爬取任务已启动'})
+    return jsonify({'success': True, 'message': '爬取任务已启动', 'job_id': job.id})
 
 @app.route('/api/progress')
 def get_progress():
-    """获取任务进度"""
-    return jsonify(task_progress)
+    """获取最近一个任务的进度（兼容旧接口，按任务查询请使用 /api/jobs/<任务ID>）"""
+    job = jobs.latest()
+    if job is None:
+        return jsonify({"status": "idle", "progress": 0, "message": "", "details": []})
+    return jsonify(job.to_dict())
+
+@app.route('/api/jobs')
+def list_jobs():
+    """列出任务（不含结果），可按 type 参数过滤"""
+    return jsonify([job.to_dict(include_result=False) for job in jobs.list(request.args.get('type'))])
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """获取任务的状态、进度和结果"""
+    job = jobs.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': '任务不存在'}), 404
+    return jsonify(job.to_dict())
 
 @app.route('/api/generate_report', methods=['POST'])
 def generate_report():
-    """生成AI日报"""
-    global task_progress
+    """生成AI日报（登记为任务，在请求线程中直接执行并同步返回结果）"""
+    data = request.json
+    target_date = data.get('date', date.today().strftime('%Y-%m-%d'))
+    articles = data.get('articles', [])
     
     try:
-        data = request.json
-        target_date = data.get('date', date.today().strftime('%Y-%m-%d'))
-        articles = data.get('articles', [])
-        
         if not articles:
             # 尝试从缓存加载
             cache_file = os.path.join(Config.CACHE_DIR, f"articles_{target_date.replace('-', '')}.json")
@@ -326,58 +307,43 @@ def generate_report():
                 with open(cache_file, 'r', encoding='utf-8') as f:
                     cache_data = json.load(f)
                     articles = cache_data.get('articles', [])
-        
-        if not articles:
-            return jsonify({'success': False, 'error': '没有可用的文章数据'}), 400
-        
-        task_progress = {
-            "status": "running",
-            "progress": 0,
-            "message": "正在生成AI日报...",
-            "details": []
-        }
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+    
+    if not articles:
+        return jsonify({'success': False, 'error': '没有可用的文章数据'}), 400
+    
+    def report_task(job):
+        job.update("正在生成AI日报...")
         
         # 使用DeepSeek生成日报
-        api = DeepSeekAPI()
-        result = run_async(api.generate_daily_report(articles, target_date))
+        result = async_loop.call('deepseek', 'generate_daily_report', articles, target_date)
+        if not result.get('success'):
+            raise RuntimeError(f"日报生成失败: {result.get('error', '未知错误')}")
         
-        if result.get('success'):
-            # 保存日报
-            report_file = os.path.join(Config.REPORTS_DIR, f"report_{target_date.replace('-', '')}.json")
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
-            
-            # 保存markdown文件
-            md_file = os.path.join(Config.REPORTS_DIR, f"report_{target_date.replace('-', '')}.md")
-            with open(md_file, 'w', encoding='utf-8') as f:
-                f.write(result['content'])
-            
-            task_progress["status"] = "completed"
-            task_progress["progress"] = 100
-            task_progress["message"] = "AI日报生成成功"
-            
-            return jsonify({
-                'success': True,
-                'report': result,
-                'files': {
-                    'json': report_file,
-                    'markdown': md_file
-                }
-            })
-        else:
-            task_progress["status"] = "error"
-            task_progress["message"] = f"日报生成失败: {result.get('error', '未知错误')}"
-            
-            return jsonify({
-                'success': False,
-                'error': result.get('error', '日报生成失败')
-            }), 500
-            
-    except Exception as e:
-        task_progress["status"] = "error"
-        task_progress["message"] = f"生成日报时出错: {str(e)}"
+        # 保存日报
+        report_file = os.path.join(Config.REPORTS_DIR, f"report_{target_date.replace('-', '')}.json")
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
         
-        return jsonify({'success': False, 'error': str(e)}), 500
+        # 保存markdown文件
+        md_file = os.path.join(Config.REPORTS_DIR, f"report_{target_date.replace('-', '')}.md")
+        with open(md_file, 'w', encoding='utf-8') as f:
+            f.write(result['content'])
+        
+        job.update("AI日报生成成功")
+        return {
+            'report': result,
+            'files': {
+                'json': report_file,
+                'markdown': md_file
+            }
+        }
+    
+    job = jobs.run('report', report_task, {'date': target_date})
+    if job.status == 'error':
+        return jsonify({'success': False, 'job_id': job.id, 'error': job.error}), 500
+    return jsonify(dict(job.result, success=True, job_id=job.id))
 
 @app.route('/api/send_report', methods=['POST'])
 def send_report():
@@ -390,8 +356,7 @@ def send_report():
         if not content:
             return jsonify({'success': False, 'error': '没有可发送的内容'}), 400
         
-        webhook = KingsoftWebhook()
-        result = run_async(webhook.send_daily_report(content, target_date))
+        result = async_loop.call('webhook', 'send_daily_report', content, target_date)
         
         return jsonify(result)
         
@@ -456,9 +421,8 @@ def generate_poster():
         
         # 如果有自定义HTML，优先使用AI生成
         if not custom_html and data.get('use_ai', False):
-            api = DeepSeekAPI()
             try:
-                html_result = run_async(api.generate_poster_html(content, target_date))
+                html_result = async_loop.call('deepseek', 'generate_poster_html', content, target_date)
                 if html_result.get('success'):
                     custom_html = html_result['html']
                     logger.info("使用AI生成的HTML模板")
@@ -466,13 +430,9 @@ def generate_poster():
                     logger.warning(f"AI生成HTML失败，将使用默认模板: {html_result.get('error')}")
             except Exception as e:
                 logger.error(f"AI生成HTML异常: {e}")
-            finally:
-                # 确保关闭session
-                run_async(api.close_session())
         
-        # 生成海报
-        generator = PosterGenerator()
-        result = run_async(generator.generate_poster_from_report(content, target_date, custom_html))
+        # 生成海报（复用常驻页面池中的预热页面）
+        result = async_loop.call('poster', 'generate_poster_from_report', content, target_date, custom_html)
         
         # 增强返回结果的信息
         if result.get('success'):
@@ -499,8 +459,7 @@ def send_poster():
         if not os.path.exists(image_path):
             return jsonify({'success': False, 'error': '海报文件不存在'}), 400
         
-        webhook = KingsoftWebhook()
-        result = run_async(webhook.send_poster_only(image_path=image_path, date=target_date))
+        result = async_loop.call('webhook', 'send_poster_only', image_path=image_path, date=target_date)
         
         return jsonify(result)
         
@@ -562,6 +521,10 @@ if __name__ == '__main__':
     logger.info(f"DeepSeek API配置: {'✅ 已配置' if Config.DEEPSEEK_API_KEY else '❌ 未配置'}")
     logger.info(f"Webhook配置: {'✅ 已配置' if Config.KINGSOFT_WEBHOOK_URL else '❌ 未配置'}")
     
+    if Config.AIBASE_CONFIG.get('follow_enabled'):
+        logger.info("启动AIBase快讯持续跟踪...")
+        start_aibase_follow()
+    
     app.run(
         host=Config.HOST,
         port=Config.PORT,
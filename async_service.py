@@ -0,0 +1,138 @@
+"""
+常驻事件循环服务
+应用持有一个长期运行的asyncio事件循环线程，所有异步任务都提交到该循环执行；
+HTTP会话、浏览器页面池、LLM客户端等长连接资源在该循环上创建一次，跨API调用保持预热复用
+"""
+import asyncio
+import inspect
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLoopService:
+    """
+    后台事件循环线程
+    Args:
+        name: 线程名称
+    """
+
+    def __init__(self, name: str = 'async-loop'):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        # 客户端名称 -> (创建函数, 关闭函数)
+        self._factories: Dict[str, Tuple[Callable[[], Any], Optional[Callable[[Any], Awaitable]]]] = {}
+        self._clients: Dict[str, Any] = {}
+        self._client_locks: Dict[str, asyncio.Lock] = {}
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        self.start()
+        return self._loop
+
+    def start(self):
+        """启动事件循环线程（重复调用无副作用）"""
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+                loop.close()
+
+            self._loop = loop
+            self._client_locks = {}
+            self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+            self._thread.start()
+            ready.wait()
+            logger.info(f"后台事件循环 {self.name} 已启动")
+
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        把协程提交到后台循环执行，立即返回 concurrent.futures.Future
+        可在任意线程调用；对返回的 Future 调用 cancel() 会取消循环上的任务
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """提交协程并阻塞等待结果（供Flask请求线程使用，不能在循环线程内调用）"""
+        if self._thread is threading.current_thread():
+            raise RuntimeError("不能在后台事件循环线程内同步等待，请直接 await")
+        return self.submit(coro).result(timeout)
+
+    def register_client(self, name: str, factory: Callable[[], Any],
+                        close: Optional[Callable[[Any], Awaitable]] = None):
+        """
+        注册长连接客户端，首次通过 client() 获取时在后台循环上创建
+        Args:
+            factory: 创建函数，可以是普通函数或协程函数
+            close: 关闭函数（协程函数），在 reset_client / stop 时调用
+        """
+        self._factories[name] = (factory, close)
+
+    async def client(self, name: str) -> Any:
+        """获取（必要时创建）已注册的客户端，只能在后台循环上调用"""
+        if name in self._clients:
+            return self._clients[name]
+        if name not in self._factories:
+            raise KeyError(f"未注册的客户端: {name}")
+        lock = self._client_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            if name not in self._clients:
+                factory, _ = self._factories[name]
+                client = factory()
+                if inspect.isawaitable(client):
+                    client = await client
+                self._clients[name] = client
+                logger.info(f"已创建长连接客户端: {name}")
+        return self._clients[name]
+
+    def call(self, name: str, method: str, *args, **kwargs) -> Any:
+        """在后台循环上调用客户端的异步方法并阻塞等待结果（供Flask请求线程使用）"""
+        async def invoke():
+            client = await self.client(name)
+            return await getattr(client, method)(*args, **kwargs)
+        return self.run(invoke())
+
+    async def reset_client(self, name: str):
+        """关闭并丢弃客户端（如配置变更后），下次获取时重新创建"""
+        client = self._clients.pop(name, None)
+        if client is None:
+            return
+        _, close = self._factories.get(name, (None, None))
+        if close:
+            try:
+                await close(client)
+            except Exception as e:
+                logger.warning(f"关闭客户端 {name} 失败: {e}")
+
+    async def _shutdown(self):
+        """取消仍在运行的任务（如持续跟踪），再关闭所有客户端"""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for name in list(self._clients):
+            await self.reset_client(name)
+
+    def stop(self, timeout: float = 10):
+        """取消未完成的任务、关闭所有客户端并停止事件循环线程"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        try:
+            self.submit(self._shutdown()).result(timeout)
+        except Exception as e:
+            logger.warning(f"关闭客户端失败: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info(f"后台事件循环 {self.name} 已停止")
@@ -0,0 +1,160 @@
+"""
+AIBase页面解析微基准
+使用 benchmarks/fixtures 下的页面样本，对比重构前的逐条正则解析（legacy_parse）
+与当前 AIBaseNewsScraper._parse_news_from_html 的单页解析耗时，并校验两者输出一致
+
+用法:
+    python benchmarks/bench_aibase_parse.py [--rounds 200]
+"""
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT_DIR, 'benchmarks', 'fixtures')
+sys.path.insert(0, ROOT_DIR)
+
+from scrapers.aibase_news_scraper import AIBaseNewsScraper, IMAGE_CONFIG
+
+
+def legacy_is_decorative_or_related_image(src: str, alt: str) -> bool:
+    """重构前的装饰性图片判断（逐条 re.search）"""
+    decorative_patterns = [
+        r'logo', r'icon', r'avatar', r'banner', r'placeholder',
+        r'loading', r'1x1|1\*1', r'\.gif$', r'ad[s]?[_\-]',
+        r'share|social', r'button|btn', r'data:image/svg',
+        r'thumb|thumbnail', r'small|sm\.', r'list\.|item\.',
+    ]
+    src_lower = src.lower()
+    for pattern in decorative_patterns:
+        if re.search(pattern, src_lower):
+            return True
+    return False
+
+
+def legacy_is_irrelevant_content(text: str) -> bool:
+    """重构前的无关内容判断（逐条 re.match）"""
+    irrelevant_patterns = [
+        r'^阅读原文$', r'^查看更多$', r'^展开.*%$',
+        r'^点击.*查看$', r'^相关.*：$', r'^标签.*：$',
+        r'^分享$', r'^收藏$', r'^点赞$', r'^评论$',
+        r'^\d+$', r'^[<>\/\s]*$',
+    ]
+    stripped_text = text.strip()
+    for pattern in irrelevant_patterns:
+        if re.match(pattern, stripped_text, re.IGNORECASE):
+            return True
+    return len(stripped_text) < 10
+
+
+def legacy_parse(scraper: AIBaseNewsScraper, news_id: int, html: str):
+    """重构前的 _parse_news_from_html 实现，仅用于基准对比"""
+    if "404" in html or "not found" in html.lower():
+        return None
+    title_patterns = [
+        r'<h1[^>]*>(.*?)</h1>',
+        r'<title[^>]*>(.*?)</title>',
+        r'class="[^"]*title[^"]*"[^>]*>(.*?)</[^>]+>',
+        r'<meta\s+property="og:title"\s+content="([^"]*)"',
+    ]
+    title = ""
+    for pattern in title_patterns:
+        match = re.search(pattern, html, re.IGNORECASE | re.DOTALL)
+        if match:
+            title = re.sub(r'<[^>]+>', '', match.group(1)).strip()
+            if title and len(title) > 5:
+                break
+    if not title:
+        return None
+    time_patterns = [
+        r'发布时间\s*[:：]\s*(\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2})',
+        r'(\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2})',
+        r'(\d{4}-\d{2}-\d{2}\s*\d{2}:\d{2})',
+        r'(\d{4}/\d{2}/\d{2}\s*\d{2}:\d{2})',
+        r'"datePublished"[^>]*content="([^"]*)"',
+        r'<time[^>]*datetime="([^"]*)"',
+    ]
+    publish_time = ""
+    for pattern in time_patterns:
+        match = re.search(pattern, html, re.IGNORECASE)
+        if match:
+            publish_time = match.group(1)
+            break
+    content_patterns = [
+        r'<p[^>]*>(.*?)</p>',
+        r'<div[^>]*class="[^"]*content[^"]*"[^>]*>(.*?)</div>',
+    ]
+    content_paragraphs = []
+    for pattern in content_patterns:
+        for match in re.findall(pattern, html, re.IGNORECASE | re.DOTALL):
+            clean_text = re.sub(r'<[^>]+>', '', match).strip()
+            clean_text = re.sub(r'\s+', ' ', clean_text)
+            if clean_text and len(clean_text) > 10 and not legacy_is_irrelevant_content(clean_text):
+                content_paragraphs.append(clean_text)
+    images = []
+    if IMAGE_CONFIG.get('enabled', False):
+        img_pattern = r'<img[^>]*src=["\']([^"\']*)["\'][^>]*(?:alt=["\']([^"\']*)["\'])?[^>]*>'
+        for src, alt in re.findall(img_pattern, html, re.IGNORECASE)[:IMAGE_CONFIG.get('max_images_per_news', 5)]:
+            if src:
+                if src.startswith('/'):
+                    src = f"https://news.aibase.com{src}"
+                elif src.startswith('//'):
+                    src = f"https:{src}"
+                elif not src.startswith(('http://', 'https://')):
+                    src = f"https://news.aibase.com/{src}"
+                if not legacy_is_decorative_or_related_image(src, alt):
+                    images.append({'url': src, 'alt': alt.strip() if alt else '', 'position': len(images)})
+    standard_time = scraper._parse_publish_time(publish_time)
+    return {
+        'id': news_id,
+        'title': title,
+        'url': f"{scraper.base_url}/{news_id}",
+        'time': standard_time,
+        'date': standard_time.split(' ')[0] if ' ' in standard_time else standard_time[:10],
+        'time_text': publish_time,
+        'content': '\n\n'.join(content_paragraphs),
+        'images': images,
+        'structured_content': [],
+        'summary': "",
+        'source': 'AIBase快讯',
+        'weight': scraper.source_weight
+    }
+
+
+def bench(func, rounds: int) -> float:
+    """返回单次调用的平均耗时（毫秒）"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='AIBase页面解析微基准')
+    parser.add_argument('--rounds', type=int, default=200, help='每个样本重复解析的次数')
+    args = parser.parse_args()
+
+    scraper = AIBaseNewsScraper(use_index=False)
+    fixtures = sorted(glob.glob(os.path.join(FIXTURES_DIR, 'aibase_news_*.html')))
+    if not fixtures:
+        print(f"未找到样本页面: {FIXTURES_DIR}")
+        return
+
+    print(f"{'样本':<24}{'大小(KB)':>10}{'重构前(ms)':>12}{'当前(ms)':>12}{'加速比':>8}  输出一致")
+    for path in fixtures:
+        news_id = int(re.search(r'(\d+)', os.path.basename(path)).group(1))
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+
+        same = legacy_parse(scraper, news_id, html) == scraper._parse_news_from_html(news_id, html)
+        before = bench(lambda: legacy_parse(scraper, news_id, html), args.rounds)
+        after = bench(lambda: scraper._parse_news_from_html(news_id, html), args.rounds)
+        print(f"{os.path.basename(path):<24}{len(html.encode('utf-8')) / 1024:>10.1f}"
+              f"{before:>12.3f}{after:>12.3f}{before / after:>8.1f}x  {'是' if same else '否'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+AIBase采集器启动开销基准测试
+对比纯HTTP模式与浏览器模式的启动耗时和内存占用（含Chromium子进程）
+浏览器按需启动，浏览器模式一行显式调用 _ensure_browser() 测量启动浏览器的开销
+
+用法:
+    python benchmarks/bench_aibase_startup.py
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import psutil
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def tree_rss_mb() -> float:
+    """当前进程及其所有子进程的RSS总和（MB）"""
+    process = psutil.Process()
+    total = process.memory_info().rss
+    for child in process.children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            pass
+    return total / 1024 / 1024
+
+
+async def measure(http_only: bool) -> dict:
+    """在当前进程中测量一次启动"""
+    rss_before = tree_rss_mb()
+    start = time.perf_counter()
+    from scrapers.aibase_news_scraper import AIBaseNewsScraper
+    scraper = AIBaseNewsScraper(use_index=False, http_only=http_only)
+    try:
+        await scraper.initialize_browser()
+        if not http_only:
+            await scraper._ensure_browser()
+        elapsed = time.perf_counter() - start
+        rss_after = tree_rss_mb()
+        child_processes = len(psutil.Process().children(recursive=True))
+    finally:
+        await scraper.close_browser()
+    return {
+        'startup_seconds': round(elapsed, 3),
+        'rss_delta_mb': round(rss_after - rss_before, 1),
+        'child_processes': child_processes
+    }
+
+
+def run_child(http_only: bool) -> dict:
+    """在独立子进程中测量，避免两种模式互相影响"""
+    result = subprocess.run(
+        [sys.executable, __file__, '--child', '1' if http_only else '0'],
+        capture_output=True, text=True, cwd=ROOT_DIR
+    )
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if 'Error' in line]
+        return {'error': errors[-1].strip() if errors else '未知错误'}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    rows = [('纯HTTP模式', run_child(True)), ('浏览器模式', run_child(False))]
+    print(f"{'模式':<10}{'启动耗时(s)':>14}{'内存增量(MB)':>16}{'子进程数':>12}")
+    for name, data in rows:
+        if 'error' in data:
+            print(f"{name:<10}  失败: {data['error']}")
+            continue
+        print(f"{name:<10}{data['startup_seconds']:>14}{data['rss_delta_mb']:>16}{data['child_processes']:>12}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == '--child':
+        print(json.dumps(asyncio.run(measure(sys.argv[2] == '1'))))
+    else:
+        main()
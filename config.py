@@ -29,12 +29,54 @@ class Config:
     
     # 爬虫配置
     CRAWLER_CONFIG = {
-        'concurrent_limit': 4,
+        'concurrent_limit': 4,               # 初始并发数，运行中按延迟与错误自适应调整
+        'min_concurrent_limit': 1,           # 自适应并发下限
+        'max_concurrent_limit': 8,           # 自适应并发上限
+        'browser_pool_size': 4,              # 浏览器页面池大小（同时打开的页面上限）
+        'page_max_uses': 20,                 # 单个页面复用多少次后回收重建
+        'max_list_scrolls': 30,              # 列表页最多滚动次数（越过起始日期或列表不再增长时提前停止）
+        'http_first': True,                  # 详情页先直接HTTP获取解析，正文不足时才用浏览器渲染
+        'parse_pool_mode': 'thread',         # 详情页HTML解析工作池: thread / process（多核） / inline（在事件循环中解析）
+        'parse_workers': 2,                  # 解析线程/进程数
+        'parse_queue_size': 8,               # 抓取与解析之间的有界队列长度，满时抓取方等待
+        'block_resources': True,             # 浏览器页面是否拦截无关资源
+        'blocked_resource_types': ['image', 'media', 'font'],  # 按资源类型拦截
+        'blocked_domains': [                 # 按域名拦截（含子域名）：广告与统计
+            'hm.baidu.com', 'pos.baidu.com', 'cpro.baidu.com', 'cnzz.com',
+            'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+            'mmstat.com', 'tanx.com', 'ad.sohu.com', 'go.sohu.com', 'pv.sohu.com'
+        ],
+        'blocked_size_estimates': {          # 被拦截资源的单个估算大小（字节），用于估算节省的流量
+            'image': 51200, 'media': 1048576, 'font': 40960, 'stylesheet': 20480, 'script': 30720
+        },
         'request_timeout': 30,
-        'retry_count': 3,
-        'delay_between_requests': 1
+        'crawl_deadline': None,              # 一次采集的总时间预算（秒），到期返回已获取的部分结果；None 表示不限时
+        'retry_count': 3,                    # 单篇文章失败后的重试次数
+        'delay_between_requests': 1          # 重试前的等待秒数（每次重试翻倍）
     }
-    
+
+    # AIBase快讯采集配置
+    AIBASE_CONFIG = {
+        'http_only': True,                   # 纯HTTP模式：只用aiohttp采集，不启动Chromium
+        'concurrent_limit': 8,               # 初始并发请求数，运行中按延迟与429/5xx/超时自适应调整（AIMD）
+        'min_concurrent_limit': 2,           # 自适应并发下限
+        'max_concurrent_limit': 32,          # 自适应并发上限
+        'index_enabled': True,               # 是否启用ID→发布日期的持久化索引
+        'index_file': 'aibase_index.db',     # 索引文件名（位于CACHE_DIR下）
+        'search_mode': 'gallop',             # gallop: 倍增+二分定位目标日期ID区间; walk: 从最新ID逐批向下遍历
+        'window_margin': 10,                 # 定位到的ID区间两侧额外抓取的ID数（ID与发布时间并非严格单调）
+        'max_walk_ids': 500,                 # walk模式最多遍历的ID数
+        'stop_after_older': 5,               # walk模式连续遇到多少篇早于目标日期的文章即停止
+        'probe_enabled': True,               # 探测模式：读到发布时间即停止解析，只完整下载目标日期内的文章
+        'probe_drain_limit': 65536,          # 探测模式下不需要的响应剩余不超过该字节数时读完丢弃以复用连接
+        'parse_pool_mode': 'thread',         # 页面解析工作池: thread / process（多核） / inline（在事件循环中解析）
+        'parse_workers': 2,                  # 解析线程/进程数
+        'parse_queue_size': 16,              # 抓取与解析之间的有界队列长度，满时抓取方等待
+        'follow_enabled': False,             # 随Web服务在后台持续跟踪新快讯并写入索引
+        'follow_interval': 60,               # 持续跟踪模式的轮询间隔（秒）
+        'follow_probe_window': 10            # 持续跟踪模式每次向游标之上探测的ID数
+    }
+
     # 图片配置
     IMAGE_CONFIG = {
         'enabled': True,
@@ -51,6 +93,12 @@ class Config:
         'max_cache_files': 100
     }
     
+    # 后台任务配置
+    JOB_CONFIG = {
+        'max_workers': 4,                    # 同时执行的任务数上限（采集、生成日报等），超出的任务排队
+        'history_limit': 100                 # 保留的已结束任务数，可通过 /api/jobs/<id> 查询
+    }
+    
     # 目录配置
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     CACHE_DIR = os.path.join(BASE_DIR, 'cache')
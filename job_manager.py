@@ -0,0 +1,194 @@
+"""
+后台任务管理
+每个任务（采集、生成日报、连接测试等）拥有独立的ID、状态、进度和结果，
+多个任务在有上限的工作线程中并发执行，互不覆盖进度
+"""
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ('completed', 'error')
+
+
+class Job:
+    """单个后台任务的状态、进度与结果"""
+
+    def __init__(self, job_type: str, params: Optional[Dict] = None):
+        self.id = uuid.uuid4().hex[:12]
+        self.type = job_type
+        self.params = dict(params or {})
+        self.status = 'pending'
+        self.progress = 0
+        self.message = '等待执行...'
+        self.details: List[str] = []
+        self.extra: Dict[str, Any] = {}   # 任务自定义的进度字段（如各数据源的进度通道）
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.future: Optional[Future] = None
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def update(self, message: str = None, progress: int = None, **extra):
+        """更新进度信息，extra 中的字段原样出现在 to_dict() 结果中"""
+        with self._lock:
+            if message is not None:
+                self.message = message
+            if progress is not None:
+                self.progress = progress
+            self.extra.update(extra)
+
+    def add_details(self, *details: str):
+        with self._lock:
+            self.details.extend(details)
+
+    def to_dict(self, include_result: bool = True) -> Dict:
+        with self._lock:
+            data = dict(self.extra)
+            data.update({
+                'id': self.id,
+                'type': self.type,
+                'params': self.params,
+                'status': self.status,
+                'progress': self.progress,
+                'message': self.message,
+                'details': list(self.details),
+                'result': self.result if include_result else None,
+                'error': self.error,
+                'created_at': self.created_at.isoformat(),
+                'started_at': self.started_at.isoformat() if self.started_at else None,
+                'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            })
+            return data
+
+
+class JobManager:
+    """
+    有并发上限的任务管理器
+    Args:
+        max_workers: 同时执行的任务数上限，超出的任务排队等待（状态为 pending）
+        history_limit: 保留的已结束任务数，超出时丢弃最早结束的任务
+    """
+
+    def __init__(self, max_workers: int = 4, history_limit: int = 100):
+        self.max_workers = max(1, max_workers)
+        self.history_limit = max(1, history_limit)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='job')
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, job_type: str, func: Callable[[Job], Any], params: Optional[Dict] = None) -> Job:
+        """
+        提交任务
+        Args:
+            job_type: 任务类型（如 'crawl'、'report'）
+            func: 任务函数，接收 Job 用于汇报进度，返回值作为任务结果；抛出异常时任务状态为 error
+            params: 任务参数（用于展示和查找同参数的运行中任务）
+        Returns:
+            新建的任务
+        """
+        job = Job(job_type, params)
+        with self._lock:
+            self._add(job)
+        job.future = self._executor.submit(self._run, job, func)
+        logger.info(f"任务已提交: {job.type} {job.id} {job.params}")
+        return job
+
+    def submit_unique(self, job_type: str, func: Callable[[Job], Any], params: Dict,
+                      unique_keys: Iterable[str]) -> Tuple[Job, bool]:
+        """
+        提交任务，但同类型且 unique_keys 参数相同的任务尚未结束时不重复提交
+        查找与登记在同一把锁内完成，并发请求不会提交出两个相同的任务
+        Returns:
+            (任务, 是否新提交)；已有相同任务在运行时返回该任务和False
+        """
+        with self._lock:
+            active = self._find_active(job_type, {key: params.get(key) for key in unique_keys})
+            if active:
+                return active, False
+            job = Job(job_type, params)
+            self._add(job)
+        job.future = self._executor.submit(self._run, job, func)
+        logger.info(f"任务已提交: {job.type} {job.id} {job.params}")
+        return job, True
+
+    def run(self, job_type: str, func: Callable[[Job], Any], params: Optional[Dict] = None) -> Job:
+        """
+        在调用线程中直接执行任务并返回（不占用工作线程，也不排在其他任务之后），
+        执行期间同样可按任务ID查询进度；失败时不抛出异常，任务状态为 error
+        """
+        job = Job(job_type, params)
+        with self._lock:
+            self._add(job)
+        try:
+            self._run(job, func)
+        except Exception:
+            pass
+        return job
+
+    def _add(self, job: Job):
+        """登记任务（调用方持有 self._lock）"""
+        self._jobs[job.id] = job
+        self._prune()
+
+    def _run(self, job: Job, func: Callable[[Job], Any]) -> Any:
+        with job._lock:
+            job.status = 'running'
+            job.started_at = datetime.now()
+        try:
+            result = func(job)
+        except Exception as e:
+            logger.error(f"任务失败: {job.type} {job.id}: {e}")
+            with job._lock:
+                job.status = 'error'
+                job.error = str(e)
+                job.message = f"任务失败: {str(e)}"
+                job.finished_at = datetime.now()
+            raise
+        with job._lock:
+            job.result = result
+            job.status = 'completed'
+            job.progress = 100
+            job.finished_at = datetime.now()
+        return result
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.history_limit)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self, job_type: Optional[str] = None) -> List[Job]:
+        """按提交顺序列出任务"""
+        with self._lock:
+            return [job for job in self._jobs.values() if job_type is None or job.type == job_type]
+
+    def latest(self) -> Optional[Job]:
+        """最近提交的任务"""
+        with self._lock:
+            return next(reversed(self._jobs.values()), None)
+
+    def _find_active(self, job_type: str, params: Dict) -> Optional[Job]:
+        """查找同类型、参数相同且尚未结束的任务（调用方持有 self._lock）"""
+        for job in self._jobs.values():
+            if job.type == job_type and not job.finished and \
+                    all(job.params.get(key) == value for key, value in params.items()):
+                return job
+        return None
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -7,11 +7,18 @@ from pathlib import Path
 from playwright.async_api import async_playwright
 from config import Config
 from PIL import Image # 导入Pillow库
+from scrapers.page_waits import wait_for_dom_quiet, wait_for_fonts
 
 logger = logging.getLogger(__name__)
 
 class PosterGenerator:
-    def __init__(self):
+    def __init__(self, browser_pool=None):
+        """
+        Args:
+            browser_pool: 外部共享的页面池（scrapers.browser_pool.BrowserPool），
+                          提供时复用其中的预热页面截图；为None时每次截图单独启动浏览器
+        """
+        self.browser_pool = browser_pool
         self.output_dir = Config.POSTERS_DIR
         os.makedirs(self.output_dir, exist_ok=True)
         # 更宽的海报展示尺寸
@@ -125,6 +132,15 @@ class PosterGenerator:
         """
         使用 Playwright 将 HTML 渲染为 JPG
         """
+        if self.browser_pool is not None:
+            try:
+                async with self.browser_pool.page() as page:
+                    # 复用的页面上次截图时视口已被拉高，先恢复初始尺寸再测量内容高度
+                    await page.set_viewport_size(self.viewport_size)
+                    return await self._render_page(page, html_content, output_path, quality)
+            except Exception as e:
+                logger.error(f"HTML 转 JPG 失败: {e}")
+                return False
         try:
             async with async_playwright() as p:
                 browser = await p.chromium.launch(
@@ -136,27 +152,7 @@ class PosterGenerator:
                         viewport=self.viewport_size,
                         device_scale_factor=2
                     )
-                    await page.set_content(html_content, wait_until='networkidle')
-                    await page.wait_for_timeout(1000)
-                    content_height = await page.evaluate("""
-                        () => Math.max(
-                            document.body.scrollHeight, document.body.offsetHeight,
-                            document.documentElement.clientHeight, document.documentElement.scrollHeight,
-                            document.documentElement.offsetHeight
-                        )
-                    """)
-                    await page.set_viewport_size({
-                        "width": self.viewport_size["width"],
-                        "height": max(content_height, self.viewport_size["height"])
-                    })
-                    await page.screenshot(
-                        path=output_path,
-                        type='jpeg',
-                        quality=quality,
-                        full_page=True
-                    )
-                    logger.info(f"HTML 转 JPG 成功: {output_path}")
-                    return True
+                    return await self._render_page(page, html_content, output_path, quality)
                 finally:
                     await browser.close()
         except Exception as e:
@@ -165,6 +161,37 @@ class PosterGenerator:
                 logger.error("Playwright 可能未安装: 请运行 `playwright install chromium`")
             return False
     
+    async def _render_page(self, page, html_content: str, output_path: str, quality: int) -> bool:
+        """在给定页面中载入HTML并整页截图"""
+        # load 事件时图片和样式表已加载完成；再等网页字体就绪、DOM稳定即可截图
+        await page.set_content(html_content, wait_until='load')
+        await wait_for_fonts(page, timeout=3000)
+        await wait_for_dom_quiet(page, quiet_ms=100, timeout=1000)
+        content_height = await page.evaluate("""
+            () => Math.max(
+                document.body.scrollHeight, document.body.offsetHeight,
+                document.documentElement.clientHeight, document.documentElement.scrollHeight,
+                document.documentElement.offsetHeight
+            )
+        """)
+        await page.set_viewport_size({
+            "width": self.viewport_size["width"],
+            "height": max(content_height, self.viewport_size["height"])
+        })
+        await page.screenshot(
+            path=output_path,
+            type='jpeg',
+            quality=quality,
+            full_page=True
+        )
+        logger.info(f"HTML 转 JPG 成功: {output_path}")
+        return True
+
+    async def close(self):
+        """关闭共享页面池中的浏览器"""
+        if self.browser_pool is not None:
+            await self.browser_pool.close()
+
     def _create_default_html(self, content: str, date: str) -> str:
         # ... (此部分代码保持不变)
         processed_content = self._process_markdown_content(content)
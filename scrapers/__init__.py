@@ -1,5 +1,6 @@
 from .sohu_scraper import SohuScraper
 from .aibase_news_scraper import AIBaseNewsScraper
 from .base_scraper import BaseScraper, Article
+from .sources import SOURCES, register_source, register_shared_clients, crawl_sources
 
-__all__ = ['SohuScraper', 'AIBaseNewsScraper', 'BaseScraper', 'Article']
\ No newline at end of file
+__all__ = ['SohuScraper', 'AIBaseNewsScraper', 'BaseScraper', 'Article', 'SOURCES', 'register_source', 'register_shared_clients', 'crawl_sources']
\ No newline at end of file
@@ -0,0 +1,204 @@
+"""
+AIBase快讯ID索引
+将已解析的新闻ID、发布时间以及确认不存在的ID持久化到SQLite，
+避免每次按日期采集时重复探测发布时间不会再变化的ID
+"""
+import json
+import os
+import sqlite3
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class AIBaseNewsIndex:
+    """AIBase新闻ID -> 发布日期 的磁盘索引"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self._init_schema()
+
+    @contextmanager
+    def _connect(self):
+        """每次操作使用独立连接，保证可在多个线程/事件循环中安全使用"""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _init_schema(self):
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS news (
+                    id INTEGER PRIMARY KEY,
+                    time TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    indexed_at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_news_date ON news(date);
+                CREATE TABLE IF NOT EXISTS news_dates (
+                    id INTEGER PRIMARY KEY,
+                    time TEXT NOT NULL,
+                    date TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_news_dates_date ON news_dates(date);
+                CREATE TABLE IF NOT EXISTS missing (
+                    id INTEGER PRIMARY KEY,
+                    checked_at TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                );
+            """)
+
+    @staticmethod
+    def _placeholders(ids: List[int]) -> str:
+        return ','.join('?' * len(ids))
+
+    def get_many(self, news_ids: Iterable[int]) -> Dict[int, Dict]:
+        """
+        批量读取已索引的新闻
+        Args:
+            news_ids: 新闻ID列表
+        Returns:
+            {新闻ID: 新闻数据}
+        """
+        ids = list(news_ids)
+        if not ids:
+            return {}
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT id, data FROM news WHERE id IN ({self._placeholders(ids)})", ids
+            ).fetchall()
+        return {row[0]: json.loads(row[1]) for row in rows}
+
+    def get_missing(self, news_ids: Iterable[int]) -> Set[int]:
+        """返回其中已确认不存在的ID"""
+        ids = list(news_ids)
+        if not ids:
+            return set()
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT id FROM missing WHERE id IN ({self._placeholders(ids)})", ids
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def save_news(self, news_list: List[Dict]) -> int:
+        """
+        写入已解析的新闻
+        只索引真正解析出发布时间的新闻，避免把兜底的"当前时间"固化进索引
+        Returns:
+            写入的条数
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (news['id'], news['time'], news['date'], json.dumps(news, ensure_ascii=False), now)
+            for news in news_list
+            if news.get('time_text') and news.get('time')
+        ]
+        if not rows:
+            return 0
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO news (id, time, date, data, indexed_at) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.execute(
+                f"DELETE FROM missing WHERE id IN ({self._placeholders([r[0] for r in rows])})",
+                [r[0] for r in rows]
+            )
+        return len(rows)
+
+    def get_times(self, news_ids: Iterable[int]) -> Dict[int, str]:
+        """
+        批量读取已知的发布时间（包括只探测过时间、未保存正文的ID）
+        Returns:
+            {新闻ID: 标准格式发布时间}
+        """
+        ids = list(news_ids)
+        if not ids:
+            return {}
+        placeholders = self._placeholders(ids)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT id, time FROM news WHERE id IN ({placeholders}) "
+                f"UNION SELECT id, time FROM news_dates WHERE id IN ({placeholders})",
+                ids + ids
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def save_times(self, times: Dict[int, str]):
+        """
+        记录探测到的发布时间（未下载正文）
+        Args:
+            times: {新闻ID: 标准格式发布时间 YYYY-MM-DD HH:MM:SS}
+        """
+        rows = [(news_id, time, time[:10]) for news_id, time in times.items() if time]
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO news_dates (id, time, date) VALUES (?, ?, ?)", rows
+            )
+
+    def mark_missing(self, news_ids: Iterable[int]):
+        """记录确认不存在（404）的ID"""
+        now = datetime.now().isoformat()
+        rows = [(news_id, now) for news_id in news_ids]
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO missing (id, checked_at) VALUES (?, ?)", rows
+            )
+
+    def find_newer_boundary(self, target_date: str) -> Optional[int]:
+        """
+        查找发布日期晚于目标日期的最小已索引ID
+        存在该ID时，目标日期的新闻都在它之下，无需再发现最新ID
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MIN(id) FROM (SELECT id FROM news WHERE date > ? "
+                "UNION SELECT id FROM news_dates WHERE date > ?)",
+                (target_date, target_date)
+            ).fetchone()
+        return row[0] if row and row[0] is not None else None
+
+    def _get_meta_id(self, key: str) -> Optional[int]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return int(row[0]) if row else None
+
+    def _set_meta_id(self, key: str, news_id: int):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(news_id))
+            )
+
+    def get_latest_id(self) -> Optional[int]:
+        """获取已知的最新ID"""
+        return self._get_meta_id('latest_id')
+
+    def set_latest_id(self, news_id: int):
+        """更新已知的最新ID（只增不减）"""
+        current = self.get_latest_id()
+        if current is not None and current >= news_id:
+            return
+        self._set_meta_id('latest_id', news_id)
+
+    def get_follow_cursor(self) -> Optional[int]:
+        """获取持续跟踪模式的游标：该ID及以下的新闻均已处理"""
+        return self._get_meta_id('follow_cursor')
+
+    def set_follow_cursor(self, news_id: int):
+        """保存持续跟踪模式的游标，重启后从此处继续"""
+        self._set_meta_id('follow_cursor', news_id)
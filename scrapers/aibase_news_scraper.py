@@ -1,11 +1,12 @@
 from datetime import datetime, timedelta, date
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 import asyncio
 import aiohttp
+import codecs
+import os
 import re
 import logging
 from concurrent.futures import ThreadPoolExecutor
-from playwright.async_api import async_playwright, Page, Browser
 
 try:
     from config import IMAGE_CONFIG
@@ -16,29 +17,317 @@ except ImportError:
         'processing_timeout': 30
     }
 
+try:
+    from config import Config
+    AIBASE_CONFIG = Config.AIBASE_CONFIG
+    CACHE_DIR = Config.CACHE_DIR
+except (ImportError, AttributeError):
+    AIBASE_CONFIG = {}
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache')
+
+from .aibase_index import AIBaseNewsIndex
+from .parse_pool import ParsePool
+from .concurrency import AdaptiveLimiter
+from .deadline import Deadline
+
 logger = logging.getLogger(__name__)
 
+# 页面解析用的正则全部在模块加载时预编译，避免每个段落/图片重复查找编译缓存
+TITLE_PATTERNS = [
+    re.compile(r'<h1[^>]*>(.*?)</h1>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'class="[^"]*title[^"]*"[^>]*>(.*?)</[^>]+>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'<meta\s+property="og:title"\s+content="([^"]*)"', re.IGNORECASE | re.DOTALL),
+]
+TIME_PATTERNS = [
+    re.compile(r'发布时间\s*[:：]\s*(\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2})', re.IGNORECASE),
+    re.compile(r'(\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2})', re.IGNORECASE),
+    re.compile(r'(\d{4}-\d{2}-\d{2}\s*\d{2}:\d{2})', re.IGNORECASE),
+    re.compile(r'(\d{4}/\d{2}/\d{2}\s*\d{2}:\d{2})', re.IGNORECASE),
+    re.compile(r'"datePublished"[^>]*content="([^"]*)"', re.IGNORECASE),
+    re.compile(r'<time[^>]*datetime="([^"]*)"', re.IGNORECASE),
+]
+CONTENT_PATTERNS = [
+    re.compile(r'<p[^>]*>(.*?)</p>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'<div[^>]*class="[^"]*content[^"]*"[^>]*>(.*?)</div>', re.IGNORECASE | re.DOTALL),
+]
+IMG_PATTERN = re.compile(
+    r'<img[^>]*src=["\']([^"\']*)["\'][^>]*(?:alt=["\']([^"\']*)["\'])?[^>]*>', re.IGNORECASE
+)
+TAG_PATTERN = re.compile(r'<[^>]+>')
+# 多个判定规则合并为一个正则，一次匹配代替逐条尝试
+IRRELEVANT_PATTERN = re.compile(
+    r'^(?:阅读原文|查看更多|展开.*%|点击.*查看|相关.*：|标签.*：'
+    r'|分享|收藏|点赞|评论|\d+|[<>\/\s]*)$',
+    re.IGNORECASE
+)
+DECORATIVE_IMAGE_PATTERN = re.compile(
+    r'logo|icon|avatar|banner|placeholder'
+    r'|loading|1x1|1\*1|\.gif$|ad[s]?[_\-]'
+    r'|share|social|button|btn|data:image/svg'
+    r'|thumb|thumbnail|small|sm\.|list\.|item\.'
+)
+
+# 探测模式下只有优先级最高的发布时间模式可以提前停止读取：低优先级模式的匹配可能被页面后文中
+# 更高优先级的匹配取代，这类页面读完后按 parse_news_html 同样的优先级解析
+PROBE_TIME_PATTERN = TIME_PATTERNS[0]
+PROBE_CHUNK_SIZE = 4096
+PROBE_OVERLAP = 64   # 相邻两块之间保留的字符数，不小于发布时间标记的最大长度
+
+def parse_news_html(news_id: int, html: str, base_url: str, source_weight: int) -> Optional[Dict]:
+    """
+    从HTML中快速解析新闻信息（预编译正则）
+    模块级纯函数，可在线程池/进程池中执行
+    Args:
+        news_id: 新闻ID
+        html: 页面HTML
+        base_url: 新闻详情页URL前缀
+        source_weight: 来源权重
+    Returns:
+        新闻数据字典
+    """
+    try:
+        # 检查是否为404页面
+        if "404" in html or "not found" in html.lower():
+            return None
+        
+        # 提取标题
+        title = ""
+        for pattern in TITLE_PATTERNS:
+            match = pattern.search(html)
+            if match:
+                title = TAG_PATTERN.sub('', match.group(1)).strip()
+                if title and len(title) > 5:
+                    break
+        
+        if not title:
+            return None
+        
+        # 提取发布时间
+        publish_time = ""
+        for pattern in TIME_PATTERNS:
+            match = pattern.search(html)
+            if match:
+                publish_time = match.group(1)
+                break
+        
+        # 提取内容段落
+        content_paragraphs = []
+        for pattern in CONTENT_PATTERNS:
+            for match in pattern.findall(html):
+                # 清理HTML标签并合并空白
+                if '<' in match:
+                    match = TAG_PATTERN.sub('', match)
+                clean_text = ' '.join(match.split())
+                if len(clean_text) > 10 and not IRRELEVANT_PATTERN.match(clean_text):
+                    content_paragraphs.append(clean_text)
+        
+        # 提取图片（如果启用）
+        images = []
+        if IMAGE_CONFIG.get('enabled', False):
+            img_matches = IMG_PATTERN.findall(html)
+            
+            for src, alt in img_matches[:IMAGE_CONFIG.get('max_images_per_news', 5)]:
+                if src:
+                    # 转换为绝对URL
+                    if src.startswith('/'):
+                        src = f"https://news.aibase.com{src}"
+                    elif src.startswith('//'):
+                        src = f"https:{src}"
+                    elif not src.startswith(('http://', 'https://')):
+                        src = f"https://news.aibase.com/{src}"
+                    
+                    if not is_decorative_image(src):
+                        images.append({
+                            'url': src,
+                            'alt': alt.strip() if alt else '',
+                            'position': len(images)
+                        })
+        
+        # 转换时间格式
+        standard_time = parse_publish_time(publish_time)
+        
+        news_data = {
+            'id': news_id,
+            'title': title,
+            'url': f"{base_url}/{news_id}",
+            'time': standard_time,
+            'date': standard_time.split(' ')[0] if ' ' in standard_time else standard_time[:10],
+            'time_text': publish_time,
+            'content': '\n\n'.join(content_paragraphs),
+            'images': images,
+            'structured_content': [],
+            'summary': "",
+            'source': 'AIBase快讯',
+            'weight': source_weight
+        }
+        
+        return news_data
+        
+    except Exception as e:
+        logger.debug(f"解析新闻 {news_id} HTML失败: {e}")
+        return None
+
+
+def parse_publish_time(publish_time: str) -> str:
+    """解析发布时间为标准格式"""
+    if not publish_time:
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    try:
+        # 优先处理 ISO 格式 (YYYY-MM-DDTHH:MM:SS...)
+        iso_match = re.search(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})', publish_time)
+        if iso_match:
+            return datetime.fromisoformat(iso_match.group(1)).strftime("%Y-%m-%d %H:%M:%S")
+
+        time_formats = [
+            ('%Y年%m月%d日 %H:%M', r'\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2}'),
+            ('%Y-%m-%d %H:%M', r'\d{4}-\d{2}-\d{2}\s*\d{2}:\d{2}'),
+            ('%Y/%m/%d %H:%M', r'\d{4}/\d{2}/\d{2}\s*\d{2}:\d{2}'),
+            ('%m-%d %H:%M', r'\d{2}-\d{2}\s*\d{2}:\d{2}'),
+            ('%m/%d %H:%M', r'\d{2}/\d{2}\s*\d{2}:\d{2}'),
+        ]
+        
+        for fmt, pattern in time_formats:
+            match = re.search(pattern, publish_time)
+            if match:
+                time_str = match.group(0)
+                time_str = re.sub(r'\s+', ' ', time_str).strip()
+                
+                try:
+                    dt_obj = datetime.strptime(time_str, fmt)
+                    # 如果年份是1900，说明格式不带年份，需要修正为当前年份
+                    if dt_obj.year == 1900 or fmt in ['%m-%d %H:%M', '%m/%d %H:%M']:
+                        now = datetime.now()
+                        dt_obj = dt_obj.replace(year=now.year)
+                        # 如果解析出的日期比当前日期晚，说明是去年的文章
+                        if dt_obj > now:
+                            dt_obj = dt_obj.replace(year=now.year - 1)
+
+                    return dt_obj.strftime("%Y-%m-%d %H:%M:00")
+                except ValueError:
+                    continue
+    except:
+        pass
+    
+    # 如果都失败了，返回一个当前时间作为备用
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def is_decorative_image(src: str) -> bool:
+    """判断是否为装饰性图片"""
+    return DECORATIVE_IMAGE_PATTERN.search(src.lower()) is not None
+
+
+def create_session(max_limit: Optional[int] = None) -> aiohttp.ClientSession:
+    """
+    创建AIBase HTTP会话（需在事件循环内调用）
+    Args:
+        max_limit: 单主机连接数上限，默认取 AIBASE_CONFIG['max_concurrent_limit']
+    """
+    if max_limit is None:
+        max_limit = AIBASE_CONFIG.get('max_concurrent_limit', 32)
+    connector = aiohttp.TCPConnector(
+        limit=max(20, max_limit),  # 连接池大小，不低于并发上限
+        limit_per_host=max_limit,
+        keepalive_timeout=30
+    )
+    timeout = aiohttp.ClientTimeout(total=10, connect=5)
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        }
+    )
+
+
 class AIBaseNewsScraper:
     """AIBase实时快讯采集器 - 高速优化版本"""
     
-    def __init__(self):
+    def __init__(self, use_index: Optional[bool] = None, http_only: Optional[bool] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.name = "AIBase快讯"
         self.base_url = "https://news.aibase.com/zh/news"
+        self.playwright = None
         self.browser = None
         self.page = None
+        # 纯HTTP模式：采集全程只使用aiohttp会话，从不启动Chromium
+        if http_only is None:
+            http_only = AIBASE_CONFIG.get('http_only', True)
+        self.http_only = http_only
         self.logger = logging.getLogger(self.__class__.__name__)
         self.source_weight = 5
         self.latest_news_id = None
+        self._follow_cursor = None   # 未启用索引时持续跟踪模式的内存游标
+        self.partial = False         # 最近一次区间采集是否因到达截止时间而只返回了部分结果
         
         # 新增：缓存和优化相关
         self.id_cache = set()  # 缓存已处理的ID
-        self.session = None   # HTTP会话复用
-        self.concurrent_limit = 8  # 并发限制
+        # HTTP会话复用；外部传入的共享会话（常驻事件循环上的预热连接池）在采集结束时不关闭
+        self._owns_session = session is None
+        self.session = session
+        # 自适应并发：延迟平稳时逐步加并发，遇到超时/429/5xx时减半
+        self.limiter = AdaptiveLimiter(
+            initial=AIBASE_CONFIG.get('concurrent_limit', 8),
+            min_limit=AIBASE_CONFIG.get('min_concurrent_limit', 2),
+            max_limit=AIBASE_CONFIG.get('max_concurrent_limit', 32),
+            name=self.name
+        )
+        
+        # ID→发布日期的持久化索引，已解析过的ID不再重复探测
+        if use_index is None:
+            use_index = AIBASE_CONFIG.get('index_enabled', True)
+        self.index = None
+        if use_index:
+            try:
+                self.index = AIBaseNewsIndex(
+                    os.path.join(CACHE_DIR, AIBASE_CONFIG.get('index_file', 'aibase_index.db'))
+                )
+            except Exception as e:
+                logger.warning(f"AIBase索引不可用，将退回全量探测: {e}")
         
+        # 页面解析工作池：解析与网络I/O重叠执行，队列满时抓取方等待
+        self.parse_pool = ParsePool(
+            mode=AIBASE_CONFIG.get('parse_pool_mode', 'thread'),
+            workers=AIBASE_CONFIG.get('parse_workers', 2),
+            queue_size=AIBASE_CONFIG.get('parse_queue_size', 16)
+        )
+        
+    @property
+    def concurrent_limit(self) -> int:
+        """当前并发数（由自适应限流器动态调整）"""
+        return self.limiter.limit
+
+    @concurrent_limit.setter
+    def concurrent_limit(self, value: int):
+        self.limiter.limit = min(max(value, self.limiter.min_limit), self.limiter.max_limit)
+
+    def concurrency_stats(self) -> Dict:
+        """自适应并发统计：当前并发数与请求延迟分位数"""
+        return self.limiter.stats()
+
     async def initialize_browser(self):
-        """初始化浏览器实例和HTTP会话"""
+        """
+        初始化HTTP会话
+        浏览器改为按需创建：此处不启动，只在真正需要页面时由 _ensure_browser 启动（纯HTTP模式下从不启动）
+        """
+        await self._ensure_session()
+
+    async def _ensure_session(self):
+        """确保HTTP会话存在"""
+        if not self.session:
+            self.session = create_session(self.limiter.max_limit)
+
+    async def _ensure_browser(self):
+        """按需启动浏览器实例（纯HTTP模式下不可用）"""
+        if self.http_only:
+            raise RuntimeError(f"{self.name} 处于纯HTTP模式，不能启动浏览器")
         if not self.browser:
-            playwright = await async_playwright().start()
+            # 延迟导入，纯HTTP模式下连playwright都不加载
+            from playwright.async_api import async_playwright
+            
+            self.playwright = await async_playwright().start()
             browser_options = {
                 'headless': True,
                 'args': [
@@ -51,259 +340,257 @@ class AIBaseNewsScraper:
                     '--disable-javascript',  # 如果可能的话禁用JS
                 ]
             }
-            self.browser = await playwright.chromium.launch(**browser_options)
-            
-        # 初始化HTTP会话
-        if not self.session:
-            connector = aiohttp.TCPConnector(
-                limit=20,  # 连接池大小
-                limit_per_host=10,
-                keepalive_timeout=30
-            )
-            timeout = aiohttp.ClientTimeout(total=10, connect=5)
-            self.session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout,
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                }
-            )
+            self.browser = await self.playwright.chromium.launch(**browser_options)
+        return self.browser
             
     async def close_browser(self):
-        """关闭浏览器和HTTP会话"""
+        """关闭浏览器、playwright驱动和HTTP会话"""
         if self.page:
             await self.page.close()
             self.page = None
         if self.browser:
             await self.browser.close()
             self.browser = None
-        # 修复：确保 aiohttp session 被关闭
-        if self.session and not self.session.closed:
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+        if self.parse_pool.stats()['submitted']:
+            logger.info(f"解析池统计: {self.parse_pool.stats()}")
+        if self.limiter.stats()['successes']:
+            logger.info(f"并发统计: {self.limiter.stats()}")
+        self.parse_pool.shutdown()
+        # 修复：确保 aiohttp session 被关闭（外部共享的会话除外）
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
             self.session = None
 
-    async def _quick_check_news_exists(self, news_id: int) -> bool:
+    async def _check_news_status(self, news_id: int) -> Optional[int]:
         """
-        快速检查新闻ID是否存在（HTTP HEAD请求）
+        检查新闻ID的HTTP状态（HTTP HEAD请求）
         Args:
             news_id: 新闻ID
         Returns:
-            是否存在
+            HTTP状态码，超时或网络错误时返回None
         """
-        if not self.session:
-            await self.initialize_browser()
+        await self._ensure_session()
             
         try:
             url = f"{self.base_url}/{news_id}"
-            async with self.session.head(url, allow_redirects=False) as response:
-                return response.status == 200
+            async with self.limiter.track() as request:
+                async with self.session.head(url, allow_redirects=False) as response:
+                    request.status = response.status
+                    return response.status
         except asyncio.TimeoutError:
             logger.debug(f"检查新闻 {news_id} 超时")
-            return False
+            return None
         except Exception:
-            return False
+            return None
 
-    async def _batch_check_news_exists(self, news_ids: List[int]) -> List[int]:
+    async def _quick_check_news_exists(self, news_id: int) -> bool:
         """
-        批量检查新闻ID是否存在
+        快速检查新闻ID是否存在（HTTP HEAD请求）
+        Args:
+            news_id: 新闻ID
+        Returns:
+            是否存在
+        """
+        return await self._check_news_status(news_id) == 200
+
+    async def _batch_check_news_status(self, news_ids: List[int]) -> Dict[int, Optional[int]]:
+        """
+        批量检查新闻ID的HTTP状态
         Args:
             news_ids: 新闻ID列表
         Returns:
-            存在的新闻ID列表
+            {新闻ID: HTTP状态码或None}
         """
-        if not self.session:
-            await self.initialize_browser()
+        await self._ensure_session()
             
-        existing_ids = []
-        semaphore = asyncio.Semaphore(self.concurrent_limit)
+        statuses = {}
         
         async def check_single(news_id):
-            async with semaphore:
-                if await self._quick_check_news_exists(news_id):
-                    existing_ids.append(news_id)
+            # 并发由自适应限流器在 _check_news_status 内部控制
+            statuses[news_id] = await self._check_news_status(news_id)
         
         tasks = [check_single(news_id) for news_id in news_ids]
         await asyncio.gather(*tasks, return_exceptions=True)
         
-        return sorted(existing_ids)
+        return statuses
 
-    async def _get_news_html_fast(self, news_id: int) -> Optional[str]:
+    async def _batch_check_news_exists(self, news_ids: List[int]) -> List[int]:
         """
-        快速获取新闻页面HTML（使用aiohttp）
+        批量检查新闻ID是否存在
+        Args:
+            news_ids: 新闻ID列表
+        Returns:
+            存在的新闻ID列表
+        """
+        statuses = await self._batch_check_news_status(news_ids)
+        return sorted(news_id for news_id, status in statuses.items() if status == 200)
+
+    async def _get_news_page(self, news_id: int) -> Tuple[Optional[int], Optional[str]]:
+        """
+        单次GET同时判断新闻是否存在并取回页面（使用aiohttp）
         Args:
             news_id: 新闻ID
         Returns:
-            页面HTML内容
+            (HTTP状态码，网络错误时为None; 状态码为200时的页面HTML)
         """
-        if not self.session:
-            await self.initialize_browser()
+        await self._ensure_session()
             
         try:
             url = f"{self.base_url}/{news_id}"
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    return await response.text()
-                return None
+            async with self.limiter.track() as request:
+                async with self.session.get(url) as response:
+                    request.status = response.status
+                    if response.status == 200:
+                        return response.status, await response.text()
+                    return response.status, None
         except Exception as e:
             logger.debug(f"获取新闻 {news_id} HTML失败: {e}")
-            return None
+            return None, None
+
+    async def _get_news_html_fast(self, news_id: int) -> Optional[str]:
+        """
+        快速获取新闻页面HTML（使用aiohttp）
+        Args:
+            news_id: 新闻ID
+        Returns:
+            页面HTML内容
+        """
+        _, html = await self._get_news_page(news_id)
+        return html
 
     def _parse_news_from_html(self, news_id: int, html: str) -> Optional[Dict]:
         """
-        从HTML中快速解析新闻信息（使用正则表达式）
+        从HTML中快速解析新闻信息
         Args:
             news_id: 新闻ID
             html: 页面HTML
         Returns:
             新闻数据字典
         """
+        return parse_news_html(news_id, html, self.base_url, self.source_weight)
+
+    async def _parse_news_async(self, news_id: int, html: str) -> Optional[Dict]:
+        """
+        在解析工作池中解析新闻，解析期间事件循环可继续处理其他连接
+        工作池的有界队列满时在此等待，抓取速度随之受限（背压）
+        """
+        return await self.parse_pool.run(parse_news_html, news_id, html, self.base_url, self.source_weight)
+
+    async def _fetch_news(self, news_id: int) -> Tuple[Optional[int], Optional[Dict]]:
+        """
+        获取单条新闻：一次GET同时得到存在性和解析结果
+        Args:
+            news_id: 新闻ID
+        Returns:
+            (HTTP状态码或None, 新闻数据或None)
+        """
+        status, news_data = None, None
         try:
-            # 检查是否为404页面
-            if "404" in html or "not found" in html.lower():
-                return None
-            
-            # 使用正则表达式快速提取信息
-            # 提取标题
-            title_patterns = [
-                r'<h1[^>]*>(.*?)</h1>',
-                r'<title[^>]*>(.*?)</title>',
-                r'class="[^"]*title[^"]*"[^>]*>(.*?)</[^>]+>',
-                r'<meta\s+property="og:title"\s+content="([^"]*)"',
-            ]
-            
-            title = ""
-            for pattern in title_patterns:
-                match = re.search(pattern, html, re.IGNORECASE | re.DOTALL)
-                if match:
-                    title = re.sub(r'<[^>]+>', '', match.group(1)).strip()
-                    if title and len(title) > 5:
-                        break
-            
-            if not title:
-                return None
-            
-            # 提取发布时间
-            time_patterns = [
-                r'发布时间\s*[:：]\s*(\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2})',
-                r'(\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2})',
-                r'(\d{4}-\d{2}-\d{2}\s*\d{2}:\d{2})',
-                r'(\d{4}/\d{2}/\d{2}\s*\d{2}:\d{2})',
-                r'"datePublished"[^>]*content="([^"]*)"',
-                r'<time[^>]*datetime="([^"]*)"',
-            ]
-            
-            publish_time = ""
-            for pattern in time_patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
-                if match:
-                    publish_time = match.group(1)
-                    break
-            
-            # 提取内容段落
-            content_patterns = [
-                r'<p[^>]*>(.*?)</p>',
-                r'<div[^>]*class="[^"]*content[^"]*"[^>]*>(.*?)</div>',
-            ]
-            
-            content_paragraphs = []
-            for pattern in content_patterns:
-                matches = re.findall(pattern, html, re.IGNORECASE | re.DOTALL)
-                for match in matches:
-                    # 清理HTML标签
-                    clean_text = re.sub(r'<[^>]+>', '', match).strip()
-                    clean_text = re.sub(r'\s+', ' ', clean_text)
-                    if clean_text and len(clean_text) > 10 and not self._is_irrelevant_content(clean_text):
-                        content_paragraphs.append(clean_text)
-            
-            # 提取图片（如果启用）
-            images = []
-            if IMAGE_CONFIG.get('enabled', False):
-                img_pattern = r'<img[^>]*src=["\']([^"\']*)["\'][^>]*(?:alt=["\']([^"\']*)["\'])?[^>]*>'
-                img_matches = re.findall(img_pattern, html, re.IGNORECASE)
-                
-                for src, alt in img_matches[:IMAGE_CONFIG.get('max_images_per_news', 5)]:
-                    if src:
-                        # 转换为绝对URL
-                        if src.startswith('/'):
-                            src = f"https://news.aibase.com{src}"
-                        elif src.startswith('//'):
-                            src = f"https:{src}"
-                        elif not src.startswith(('http://', 'https://')):
-                            src = f"https://news.aibase.com/{src}"
-                        
-                        if not self._is_decorative_or_related_image(src, alt):
-                            images.append({
-                                'url': src,
-                                'alt': alt.strip() if alt else '',
-                                'position': len(images)
-                            })
-            
-            # 转换时间格式
-            standard_time = self._parse_publish_time(publish_time)
-            
-            news_data = {
-                'id': news_id,
-                'title': title,
-                'url': f"{self.base_url}/{news_id}",
-                'time': standard_time,
-                'date': standard_time.split(' ')[0] if ' ' in standard_time else standard_time[:10],
-                'time_text': publish_time,
-                'content': '\n\n'.join(content_paragraphs),
-                'images': images,
-                'structured_content': [],
-                'summary': "",
-                'source': 'AIBase快讯',
-                'weight': self.source_weight
-            }
-            
-            return news_data
-            
+            status, html = await self._get_news_page(news_id)
+            if html:
+                news_data = await self._parse_news_async(news_id, html)
         except Exception as e:
-            logger.debug(f"解析新闻 {news_id} HTML失败: {e}")
-            return None
+            logger.debug(f"获取新闻 {news_id} 失败: {e}")
+        return status, news_data
 
-    async def _batch_get_news_fast(self, news_ids: List[int]) -> List[Dict]:
+    async def _probe_news(self, news_id: int, wanted=None) -> Tuple[Optional[int], Optional[str], Optional[Dict]]:
         """
-        批量快速获取新闻信息
+        探测模式：流式读取新闻页面，一旦读到发布时间即停止解析
+        只有 wanted(发布日期) 为True时才继续读完同一响应并完整解析，不发第二次请求。
+        不需要的响应剩余部分不超过 probe_drain_limit 时读完丢弃，使连接能归还连接池复用，
+        否则放弃读取（连接随之关闭，下次请求需要重新建连）。
         Args:
-            news_ids: 新闻ID列表
+            news_id: 新闻ID
+            wanted: 接收发布日期、返回是否需要完整内容的函数；为None时只探测时间
         Returns:
-            新闻数据列表
+            (HTTP状态码或None, 标准格式发布时间或None, 完整新闻数据或None)
         """
-        news_list = []
-        semaphore = asyncio.Semaphore(self.concurrent_limit)
-        
-        async def get_single_news(news_id):
-            async with semaphore:
-                try:
-                    html = await self._get_news_html_fast(news_id)
-                    if html:
-                        news_data = self._parse_news_from_html(news_id, html)
-                        if news_data:
-                            return news_data
-                except Exception as e:
-                    logger.debug(f"批量获取新闻 {news_id} 失败: {e}")
-                return None
-        
-        # 并发执行
-        tasks = [get_single_news(news_id) for news_id in news_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await self._ensure_session()
         
-        # 过滤有效结果
-        for result in results:
-            if isinstance(result, dict):
-                news_list.append(result)
-        
-        return news_list
+        try:
+            url = f"{self.base_url}/{news_id}"
+            async with self.limiter.track() as request:
+                async with self.session.get(url) as response:
+                    request.status = response.status
+                    if response.status != 200:
+                        return response.status, None, None
+                    
+                    encoding = response.charset or 'utf-8'
+                    # 增量解码，每块只搜索新解码的文本加上一块末尾的重叠部分，总开销与页面大小成线性
+                    decoder = codecs.getincrementaldecoder(encoding)(errors='ignore')
+                    chunks = []
+                    tail = ""
+                    publish_time = ""
+                    async for chunk in response.content.iter_chunked(PROBE_CHUNK_SIZE):
+                        chunks.append(chunk)
+                        text = tail + decoder.decode(chunk)
+                        match = PROBE_TIME_PATTERN.search(text)
+                        if match:
+                            publish_time = match.group(1)
+                            break
+                        tail = text[-PROBE_OVERLAP:]
+                    buffer = b''.join(chunks)
+                    
+                    if publish_time:
+                        standard_time = parse_publish_time(publish_time)
+                        news_date = datetime.strptime(standard_time, "%Y-%m-%d %H:%M:%S").date()
+                        if not wanted or not wanted(news_date):
+                            await self._drain_response(response)
+                            return response.status, standard_time, None
+                        # 目标日期内：读完同一响应的剩余部分
+                        buffer += await response.read()
+            
+            # 已读到文档末尾（或需要完整内容），释放并发槽位后再按完整页面解析
+            news_data = await self._parse_news_async(news_id, buffer.decode(encoding, errors='ignore'))
+            if news_data and news_data.get('time_text'):
+                return response.status, news_data['time'], news_data
+            return response.status, None, news_data
+        except Exception as e:
+            logger.debug(f"探测新闻 {news_id} 失败: {e}")
+            return None, None, None
+
+    @staticmethod
+    async def _drain_response(response):
+        """读完并丢弃较小的剩余响应体，使连接能归还连接池；剩余部分过大时放弃"""
+        limit = AIBASE_CONFIG.get('probe_drain_limit', 65536)
+        drained = 0
+        while drained <= limit:
+            chunk = await response.content.readany()
+            if not chunk:
+                return
+            drained += len(chunk)
+
+    def _remember_fetch_results(self, results: Dict[int, Tuple[Optional[int], Optional[Dict]]]):
+        """
+        将抓取结果写入索引，下次采集直接复用
+        只记录明确404的ID为不存在，超时等瞬时错误下次仍会重试；
+        已知最新ID之上的404只是尚未发布，不记为不存在
+        """
+        if not self.index or not results:
+            return
+        news_list = [news for _, news in results.values() if news]
+        if news_list:
+            self.index.save_news(news_list)
+        highest = max([self.index.get_latest_id() or 0] + [news['id'] for news in news_list])
+        self.index.mark_missing(
+            news_id for news_id, (status, _) in results.items()
+            if status in (404, 410) and news_id <= highest
+        )
 
     async def _discover_latest_news_id_fast(self) -> Optional[int]:
         """
-        快速发现最新新闻ID（二分查找优化）
+        快速发现最新新闻ID（并行k叉查找）
         """
-        if not self.session:
-            await self.initialize_browser()
+        await self._ensure_session()
+        
+        # 索引中记录的最新ID可作为搜索下界，避免从过旧的位置开始向上探测
+        known_latest = self.index.get_latest_id() if self.index else None
         
         try:
+            latest_id = None
             # 首先尝试从首页获取
             async with self.session.get(self.base_url) as response:
                 if response.status == 200:
@@ -314,54 +601,90 @@ class AIBaseNewsScraper:
                         max_id = max(int(link) for link in links)
                         logger.info(f"从首页发现最大ID: {max_id}")
                         
-                        # 使用二分查找确定真正的最新ID
-                        latest_id = await self._binary_search_latest_id(max_id)
-                        return latest_id
+                        # 使用并行k叉查找确定真正的最新ID
+                        latest_id = await self._binary_search_latest_id(max(max_id, known_latest or 0))
             
-            # 如果首页方法失败，使用保守估计
-            estimated_id = 21000  # 基于当前趋势的估计
-            return await self._binary_search_latest_id(estimated_id)
+            if latest_id is None:
+                # 如果首页方法失败，使用索引记录或保守估计
+                estimated_id = known_latest or 21000  # 基于当前趋势的估计
+                latest_id = await self._binary_search_latest_id(estimated_id)
+            
+            if self.index:
+                self.index.set_latest_id(latest_id)
+            return latest_id
             
         except Exception as e:
             logger.error(f"快速发现最新ID失败: {e}")
             return None
 
-    async def _binary_search_latest_id(self, start_id: int) -> int:
+    async def _binary_search_latest_id(self, start_id: int, confirm_window: int = 5,
+                                       max_rounds: int = 20) -> int:
         """
-        使用二分查找确定最新的有效ID
+        并行k叉查找确定最新的有效ID
+        每轮按 concurrent_limit 并发探测k个候选ID，区间缩小为原来的 1/(k+1)；
+        由于ID存在空洞，最终边界上方需连续 confirm_window 个ID都不存在才算确认。
         Args:
             start_id: 起始搜索ID
+            confirm_window: 确认边界时检查的上方邻居ID数
+            max_rounds: 最多探测轮数
         Returns:
             最新的有效ID
         """
-        # 首先向上搜索找到一个不存在的ID
-        upper_bound = start_id
-        step = 100
-        
-        while await self._quick_check_news_exists(upper_bound):
-            upper_bound += step
-            step = min(step * 2, 1000)  # 指数增长，但限制最大步长
+        k = max(self.concurrent_limit, 2)
+        lo = start_id   # 已知存在（或作为兜底）的ID
+        hi = None       # 探测为不存在的ID，None表示尚未找到上界
         
-        # 现在在 start_id 和 upper_bound 之间二分查找
-        left, right = start_id, upper_bound
-        latest_valid = start_id
-        
-        while left <= right:
-            mid = (left + right) // 2
-            if await self._quick_check_news_exists(mid):
-                latest_valid = mid
-                left = mid + 1
+        for round_count in range(1, max_rounds + 1):
+            full_scan = hi is not None and hi - lo - 1 + confirm_window <= 2 * k
+            if hi is None:
+                # 向上倍增探测：一轮并发探测 lo, lo+16, lo+32, ..., lo+16*2^(k-2)
+                probes = [lo] + [lo + 16 * 2 ** j for j in range(k - 1)]
+            elif full_scan:
+                # 区间已足够小：一次性探测区间内全部ID及上方确认窗口
+                probes = list(range(lo + 1, hi + confirm_window))
             else:
-                right = mid - 1
+                # k叉划分
+                probes = sorted({lo + (hi - lo) * i // (k + 1) for i in range(1, k + 1)} - {lo, hi})
+            
+            statuses = await self._batch_check_news_status(probes)
+            existing = [news_id for news_id in probes if statuses.get(news_id) == 200]
+            logger.debug(f"第 {round_count} 轮探测 {len(probes)} 个ID，存在 {len(existing)} 个")
+            
+            if hi is None:
+                if not existing:
+                    logger.warning(f"起始ID {start_id} 附近均不存在，无法确定最新ID")
+                    return start_id
+                top = max(existing)
+                if top == probes[-1]:
+                    # 最远的探测点仍存在，继续向上
+                    lo = top
+                    continue
+                lo = top
+                hi = min(news_id for news_id in probes if news_id > top)
+                continue
+            
+            if existing:
+                lo = max(existing)
+            missing_above = [news_id for news_id in probes if news_id > lo]
+            if full_scan and set(range(lo + 1, lo + confirm_window + 1)) <= set(missing_above):
+                logger.info(f"并行k叉查找确定最新ID: {lo}（共 {round_count} 轮）")
+                return lo
+            if missing_above:
+                hi = min(missing_above)
+            if hi <= lo:
+                # 确认窗口中发现更新的ID，重新向上探测
+                hi = None
         
-        logger.info(f"二分查找确定最新ID: {latest_valid}")
-        return latest_valid
+        logger.warning(f"k叉查找超过 {max_rounds} 轮，返回当前最大有效ID: {lo}")
+        return lo
 
-    async def get_latest_news(self, limit: int = 10) -> List[Dict]:
+    async def iter_latest_news(self, limit: int = 10) -> AsyncIterator[Dict]:
         """
-        获取最新快讯（高速版本）
+        流式获取最新快讯：每条新闻解析完成即产出，不等待整批结束
+        产出顺序为完成顺序而非ID顺序；提前停止迭代时会取消未完成的请求并关闭资源
+        Args:
+            limit: 最多产出的条数
         """
-        # --- FIX START: 添加 try...finally 确保资源关闭 ---
         try:
             logger.info(f"开始高速获取最新 {limit} 条快讯")
             
@@ -371,192 +694,565 @@ class AIBaseNewsScraper:
             latest_id = await self._discover_latest_news_id_fast()
             if not latest_id:
                 logger.error("无法发现最新新闻ID")
-                return []
-            
-            # 生成候选ID列表（批量处理）
-            candidate_ids = list(range(latest_id, latest_id - limit * 2, -1))  # 多取一些以防有些ID不存在
-            
-            # 批量检查存在性
-            logger.info(f"批量检查 {len(candidate_ids)} 个候选ID的存在性...")
-            existing_ids = await self._batch_check_news_exists(candidate_ids)
-            
-            # 取前limit个
-            target_ids = existing_ids[:limit]
+                return
             
-            logger.info(f"开始并发获取 {len(target_ids)} 条新闻详情...")
-            # 批量获取新闻详情
-            news_list = await self._batch_get_news_fast(target_ids)
-            
-            # 按ID降序排序（最新的在前）
-            news_list.sort(key=lambda x: x['id'], reverse=True)
+            # 从最新ID向下逐段获取，单次GET同时判断存在性，遇到空洞再补取
+            count = 0
+            current_id = latest_id
+            lowest_id = latest_id - limit * 2  # 多取一些以防有些ID不存在
+            while count < limit and current_id > lowest_id:
+                chunk_ids = list(range(current_id, max(current_id - (limit - count), lowest_id), -1))
+                logger.info(f"开始并发获取 {len(chunk_ids)} 条新闻详情...")
+                chunk_stream = self._iter_news_ids(chunk_ids)
+                try:
+                    async for news in chunk_stream:
+                        yield news
+                        count += 1
+                        if count >= limit:
+                            break
+                finally:
+                    # 提前退出时显式关闭内层生成器，立即取消其未完成的请求
+                    await chunk_stream.aclose()
+                current_id = chunk_ids[-1] - 1
             
-            logger.info(f"高速获取完成，共获取 {len(news_list)} 条快讯")
-            return news_list
+            logger.info(f"高速获取完成，共获取 {count} 条快讯")
         finally:
             await self.close_browser()
-        # --- FIX END ---
 
-    async def get_news_by_date(self, target_date: str) -> List[Dict]:
+    async def get_latest_news(self, limit: int = 10) -> List[Dict]:
         """
-        获取指定日期的快讯（高速版本）
+        获取最新快讯（高速版本）
         """
+        news_list = [news async for news in self.iter_latest_news(limit)]
+        # 按ID降序排序（最新的在前）
+        news_list.sort(key=lambda x: x['id'], reverse=True)
+        return news_list
+
+    async def _iter_news_ids(self, news_ids: List[int]) -> AsyncIterator[Dict]:
+        """
+        流式获取一组ID对应的新闻：已索引的直接产出，已确认不存在的跳过，其余直接GET并按完成顺序产出
+        Args:
+            news_ids: 新闻ID列表
+        """
+        cached_news = self.index.get_many(news_ids) if self.index else {}
+        known_missing = self.index.get_missing(news_ids) if self.index else set()
+        pending_ids = [i for i in news_ids if i not in cached_news and i not in known_missing]
+        if cached_news:
+            logger.info(f"索引命中 {len(cached_news)} 条，实际请求 {len(pending_ids)} 条")
+        for news_id in sorted(cached_news, reverse=True):
+            yield cached_news[news_id]
+        
+        async def fetch(news_id):
+            return news_id, await self._fetch_news(news_id)
+        
+        # 单次GET同时判断存在性并获取详情（只请求索引中没有的ID）
+        tasks = [asyncio.ensure_future(fetch(news_id)) for news_id in pending_ids]
+        results = {}
         try:
-            target_date_obj = datetime.strptime(target_date, "%Y-%m-%d").date()
-            logger.info(f"开始高速获取 {target_date} 的快讯")
+            for next_done in asyncio.as_completed(tasks):
+                news_id, result = await next_done
+                results[news_id] = result
+                if result[1]:
+                    yield result[1]
+        finally:
+            # 调用方提前停止迭代时取消并等待未完成的请求，避免其在资源关闭后继续运行
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._remember_fetch_results(results)
+
+    @staticmethod
+    def _news_date(news: Dict) -> Optional[date]:
+        """解析新闻的发布日期，缺少或无法解析时返回None"""
+        try:
+            return datetime.strptime(news['time'], "%Y-%m-%d %H:%M:%S").date()
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    async def _sample_publish_date(self, news_id: int,
+                                   max_offset: int = 5) -> Optional[Tuple[int, Optional[date]]]:
+        """
+        采样news_id处（遇到空洞时向下顺延）第一篇存在的新闻的发布日期
+        Args:
+            news_id: 采样ID
+            max_offset: 最多向下顺延的ID数
+        Returns:
+            (实际采样到的ID, 发布日期)；连续 max_offset 个ID都是空洞（404或页面无发布时间）时
+            返回 (最后检查的ID, None)；遇到超时、429、5xx等请求失败时返回None，结果不可信
+        """
+        candidate = news_id
+        for candidate in range(news_id, max(news_id - max_offset, 0), -1):
+            # 索引中已有发布时间的直接使用（包括之前只探测过时间的ID）
+            known_time = self.index.get_times([candidate]).get(candidate) if self.index else None
+            if not known_time:
+                status, known_time, news = await self._probe_news(candidate)
+                self._remember_fetch_results({candidate: (status, news)})
+                if status not in (200, 404, 410):
+                    logger.debug(f"采样 ID {candidate} 请求失败（状态 {status}）")
+                    return None
+                if known_time and not news and self.index:
+                    self.index.save_times({candidate: known_time})
+            # 没有解析出发布时间的页面其time为当前时间兜底值，探测结果中不会出现，不能用于定位
+            if known_time:
+                return candidate, datetime.strptime(known_time, "%Y-%m-%d %H:%M:%S").date()
+        return candidate, None
+
+    async def _locate_date_window(self, start_id: int, first_date: date, last_date: Optional[date] = None,
+                                  max_gallop_steps: int = 20) -> Optional[Tuple[int, int]]:
+        """
+        倍增采样+二分查找定位日期区间 [first_date, last_date] 的ID区间
+        先以 1, 2, 4, 8... 的间隔向下采样发布时间，直到越过起始日期，
+        再分别二分查找区间内的第一个和最后一个ID。
+        Args:
+            start_id: 起始ID（最新ID或索引中比结束日期更新的ID）
+            first_date: 起始日期
+            last_date: 结束日期，默认与起始日期相同
+            max_gallop_steps: 最多倍增次数
+        Returns:
+            (第一个ID, 最后一个ID)；日期区间内没有文章时 first > last；
+            采样请求失败（超时、429、5xx）时返回None，由调用方退回逐批遍历。
+            连续空洞按早于起始日期处理，继续二分
+        """
+        last_date = last_date or first_date
+        top = await self._sample_publish_date(start_id)
+        if not top or top[1] is None:
+            return None
+        top_id, top_date = top
+        if top_date < first_date:
+            # 最新的文章都早于起始日期
+            return start_id + 1, start_id
+        
+        # at_or_before: 已采样的 日期<=结束日期 的最大ID；newer: 已采样的 日期>结束日期 的最小ID
+        # older: 日期<起始日期 的采样位置；not_older: 已采样的 日期>=起始日期 的最小ID
+        at_or_before = start_id if top_date <= last_date else None
+        newer = top_id if top_date > last_date else None
+        not_older = top_id
+        older = 0
+        
+        step = 1
+        for _ in range(max_gallop_steps):
+            probe_id = start_id - step
+            if probe_id <= 0:
+                # 已越过最早的ID：ID 0 视为早于起始日期
+                if at_or_before is None:
+                    at_or_before = 0
+                break
+            sample = await self._sample_publish_date(probe_id)
+            if sample is None:
+                logger.warning(f"倍增采样 ID {probe_id} 请求失败，放弃倍增查找")
+                return None
+            sample_id, sample_date = sample
+            logger.debug(f"倍增采样 ID {probe_id} -> {sample_id}: {sample_date or '连续空洞'}")
+            if sample_date is None or sample_date < first_date:
+                older = probe_id
+                if at_or_before is None:
+                    at_or_before = probe_id
+                break
+            not_older = sample_id
+            if sample_date > last_date:
+                newer = sample_id
+            elif at_or_before is None:
+                at_or_before = probe_id
+            step *= 2
+        else:
+            logger.warning(f"倍增 {max_gallop_steps} 次仍未越过起始日期，放弃倍增查找")
+            return None
+        
+        # 二分查找第一个 日期>=起始日期 的ID，区间 (older, not_older]
+        lo, hi = older, not_older
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            sample = await self._sample_publish_date(mid)
+            if sample is None:
+                logger.warning(f"二分采样 ID {mid} 请求失败，放弃倍增查找")
+                return None
+            if sample[1] is not None and sample[1] >= first_date and sample[0] > lo:
+                hi = sample[0]
+            else:
+                lo = mid
+        first_id = hi
+        
+        # 二分查找最后一个 日期<=结束日期 的ID，区间 [at_or_before, newer)
+        if newer is None:
+            last_id = start_id
+        else:
+            lo, hi = at_or_before, newer
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                sample = await self._sample_publish_date(mid)
+                if sample is None:
+                    logger.warning(f"二分采样 ID {mid} 请求失败，放弃倍增查找")
+                    return None
+                if sample[1] is None or sample[1] <= last_date:
+                    lo = mid
+                else:
+                    hi = sample[0]
+            last_id = lo
+        
+        date_label = first_date if first_date == last_date else f"{first_date} ~ {last_date}"
+        logger.info(f"倍增二分定位 {date_label} 的ID区间: {first_id} - {last_id}")
+        return first_id, last_id
+
+    async def _walk_news_by_date(self, start_id: int, first_date: date,
+                                 last_date: Optional[date] = None) -> AsyncIterator[Dict]:
+        """
+        从start_id开始向下滑动窗口遍历，直到连续遇到若干篇早于起始日期的文章，
+        日期区间 [first_date, last_date] 内的文章一经确认即产出；多天只需一次遍历
+        max_concurrent_limit 个worker持续从共享的ID序列中取ID，任一请求完成即补充下一个，
+        实际同时在途的请求数由自适应限流器控制；
+        不再按批等待；停止条件按ID顺序在结果到达时实时判断。
+        Args:
+            start_id: 起始ID
+            first_date: 起始日期
+            last_date: 结束日期，默认与起始日期相同
+        """
+        last_date = last_date or first_date
+        days = (last_date - first_date).days + 1
+        max_ids = AIBASE_CONFIG.get('max_walk_ids', 500) * days  # 最多遍历的ID数（按天数放大）
+        stop_after_older = AIBASE_CONFIG.get('stop_after_older', 5)  # 连续多少篇早于目标日期即停止
+        id_range = range(start_id, max(start_id - max_ids, 0), -1)
+        
+        # 索引一次性预取，命中的ID不占用请求槽位
+        cached_news = self.index.get_many(id_range) if self.index else {}
+        known_times = self.index.get_times(id_range) if self.index else {}
+        known_missing = self.index.get_missing(id_range) if self.index else set()
+        use_probe = AIBASE_CONFIG.get('probe_enabled', True)
+        
+        pending_ids = iter(id_range)
+        stop_event = asyncio.Event()
+        completed = {}       # 已完成但尚未被顺序扫描的ID -> 发布日期或None
+        found = asyncio.Queue()   # 已确认的目标日期文章，None 表示遍历结束
+        fetch_results = {}
+        probed_times = {}
+        state = {'frontier': start_id, 'older_streak': 0, 'processed': 0, 'found': 0}
+        
+        def advance_frontier():
+            """按ID降序扫描连续完成的结果，判断是否满足停止条件"""
+            while state['frontier'] in completed and not stop_event.is_set():
+                news_id = state['frontier']
+                news_date = completed.pop(news_id)
+                state['frontier'] -= 1
+                if not news_date:
+                    # 不存在或解析失败的ID不影响连续计数
+                    continue
+                if news_date < first_date:
+                    state['older_streak'] += 1
+                    if state['older_streak'] >= stop_after_older:
+                        logger.info(f"连续 {stop_after_older} 篇早于起始日期（最后 ID {news_id}, 日期 {news_date}），停止遍历")
+                        stop_event.set()
+                        return
+                else:
+                    state['older_streak'] = 0
+        
+        def in_range(news_date):
+            return news_date is not None and first_date <= news_date <= last_date
+        
+        def record(news_id, news_date, news=None):
+            if news and in_range(news_date):
+                found.put_nowait(news)
+                state['found'] += 1
+                logger.info(f"找到目标日期文章: ID {news_id}")
+            completed[news_id] = news_date
+            state['processed'] += 1
+            if state['processed'] % 100 == 0:
+                logger.info(f"已遍历 {state['processed']} 个ID，找到 {state['found']} 篇目标日期文章")
+            advance_frontier()
+        
+        def to_date(standard_time):
+            return datetime.strptime(standard_time, "%Y-%m-%d %H:%M:%S").date() if standard_time else None
+        
+        async def worker():
+            for news_id in pending_ids:
+                if stop_event.is_set():
+                    return
+                if news_id in cached_news:
+                    record(news_id, self._news_date(cached_news[news_id]), cached_news[news_id])
+                    continue
+                if news_id in known_missing:
+                    record(news_id, None)
+                    continue
+                if news_id in known_times and not in_range(to_date(known_times[news_id])):
+                    # 已探测过时间且不在日期区间内，无需请求
+                    record(news_id, to_date(known_times[news_id]))
+                    continue
+                if use_probe:
+                    # 读到发布时间即停止，只有日期区间内的文章才读完整个页面
+                    status, standard_time, news = await self._probe_news(news_id, wanted=in_range)
+                    fetch_results[news_id] = (status, news)
+                    if standard_time and not news:
+                        probed_times[news_id] = standard_time
+                    record(news_id, to_date(standard_time) or (self._news_date(news) if news else None), news)
+                else:
+                    fetch_results[news_id] = await self._fetch_news(news_id)
+                    news = fetch_results[news_id][1]
+                    record(news_id, self._news_date(news) if news else None, news)
+        
+        workers = asyncio.gather(*(worker() for _ in range(self.limiter.max_limit)))
+        workers.add_done_callback(lambda _: found.put_nowait(None))
+        try:
+            while True:
+                news = await found.get()
+                if news is None:
+                    break
+                yield news
+            await workers
+        finally:
+            # 调用方提前停止迭代时取消仍在进行的请求；已拿到的结果照常写入索引
+            stop_event.set()
+            if not workers.done():
+                workers.cancel()
+                try:
+                    await workers
+                except asyncio.CancelledError:
+                    pass
+            self._remember_fetch_results(fetch_results)
+            if self.index and probed_times:
+                self.index.save_times(probed_times)
+        
+        if not state['older_streak'] >= stop_after_older:
+            logger.warning(f"遍历 {state['processed']} 个ID后仍未越过起始日期")
+
+    async def iter_news_by_range(self, start_date: str, end_date: str,
+                                 search_mode: Optional[str] = None, deadline=None) -> AsyncIterator[Dict]:
+        """
+        流式获取日期区间内的快讯：从区间上界向下只定位/遍历一次ID空间，
+        每条确认属于区间内的新闻立即产出，下游（去重、缓存、进度展示）无需等待整个采集结束
+        产出顺序为完成顺序而非ID顺序；提前停止迭代时会取消未完成的请求并关闭资源
+        Args:
+            start_date: 起始日期 (YYYY-MM-DD)，包含
+            end_date: 结束日期 (YYYY-MM-DD)，包含
+            search_mode: 'gallop' 倍增+二分定位ID区间后只抓取该区间；
+                         'walk' 从最新ID逐批向下遍历；默认取 AIBASE_CONFIG['search_mode']
+            deadline: 截止时间（Deadline或秒数），到期时取消未完成的请求与解析并结束迭代，
+                      此时 self.partial 为True；None 表示不限时
+        """
+        deadline = Deadline.coerce(deadline)
+        self.partial = False
+        try:
+            first_date = datetime.strptime(start_date, "%Y-%m-%d").date()
+            last_date = datetime.strptime(end_date, "%Y-%m-%d").date()
+            if first_date > last_date:
+                raise ValueError(f"起始日期 {start_date} 晚于结束日期 {end_date}")
+            date_label = start_date if first_date == last_date else f"{start_date} ~ {end_date}"
+            search_mode = search_mode or AIBASE_CONFIG.get('search_mode', 'gallop')
+            logger.info(f"开始高速获取 {date_label} 的快讯（模式: {search_mode}）")
             
             await self.initialize_browser()
             
-            latest_id = await self._discover_latest_news_id_fast()
-            if not latest_id:
-                return []
+            # ID与发布时间并非严格单调，定位结果两侧各多取一些再按日期过滤
+            margin = AIBASE_CONFIG.get('window_margin', 10)
+            # 索引中已有比结束日期更新的文章时，直接从该位置向下查找，无需重新发现最新ID
+            start_id = self.index.find_newer_boundary(end_date) if self.index else None
+            from_index = bool(start_id)
+            if from_index:
+                logger.info(f"索引命中：从 ID {start_id} 开始向下查找，跳过最新ID发现")
+            else:
+                start_id = await deadline.run(self._discover_latest_news_id_fast())
+            if not start_id:
+                return
             
-            all_news = []
-            batch_size = 20  # 每批处理的数量
-            current_id = latest_id
-            # --- FIX START: 修正了循环终止逻辑 ---
-            stop_fetching = False # 用于控制外层 while 循环
-            max_batches = 25  # 最多处理25批（500篇文章）
-            batch_count = 0
+            seen = set()   # 以防万一有重复ID被产出
+            window = None
+            if search_mode == 'gallop':
+                window = await deadline.run(self._locate_date_window(start_id, first_date, last_date))
+                if window is None:
+                    logger.warning("倍增二分定位失败，退回逐批遍历")
             
-            while not stop_fetching and batch_count < max_batches:
-                # 生成一批ID
-                batch_ids = list(range(current_id, current_id - batch_size, -1))
-                batch_count += 1
-                
-                logger.info(f"处理第 {batch_count} 批 (ID {batch_ids[-1]} - {batch_ids[0]})")
-                
-                # 批量检查存在性
-                existing_ids = await self._batch_check_news_exists(batch_ids)
-                
-                if not existing_ids:
-                    logger.warning(f"第 {batch_count} 批没有有效ID，跳过")
-                    current_id -= batch_size
-                    continue
-                
-                # 批量获取新闻详情
-                batch_news = await self._batch_get_news_fast(existing_ids)
-                
-                # 为了逻辑更清晰，对获取到的批次按ID降序排序
-                batch_news.sort(key=lambda x: x['id'], reverse=True)
-
-                # 标记当前批次是否包含比目标日期更早的文章
-                batch_contained_older_news = False
-
-                # 遍历当前批次的所有结果，不再提前退出
-                for news in batch_news:
+            if window is not None:
+                first_id, last_id = window
+                if from_index:
+                    # 索引边界之上仍可能有日期区间内的文章（ID乱序），边界附近即使定位为空也要检查
+                    upper = max(last_id, start_id) + margin
+                else:
+                    # 起始ID是发现的最新ID：其上的ID尚未发布
+                    upper = min(last_id + margin, start_id) if first_id <= last_id else 0
+                window_ids = list(range(upper, max(first_id - margin, 1) - 1, -1))
+                news_stream = self._iter_news_ids(window_ids)
+            else:
+                walk_from = start_id + margin if from_index else start_id
+                news_stream = self._walk_news_by_date(walk_from, first_date, last_date)
+            
+            try:
+                while True:
                     try:
-                        news_date_str = news.get('time')
-                        if not news_date_str:
-                            continue
-                        news_date = datetime.strptime(news_date_str, "%Y-%m-%d %H:%M:%S").date()
-                        
-                        if news_date == target_date_obj:
-                            all_news.append(news)
-                            logger.info(f"找到目标日期文章: ID {news['id']}")
-                        elif news_date < target_date_obj:
-                            logger.info(f"遇到早于目标日期的文章: ID {news['id']}, 日期 {news_date}")
-                            # 只设置标志，不中断循环，确保本批次处理完
-                            batch_contained_older_news = True
-                    except (ValueError, KeyError):
-                        # 忽略解析时间失败或缺少 'time' 键的文章
+                        # 等待下一条时受截止时间约束，到期时取消内层生成器中所有未完成的工作
+                        news = await deadline.run(news_stream.__anext__())
+                    except StopAsyncIteration:
+                        break
+                    news_date = self._news_date(news)
+                    if news_date is None or not first_date <= news_date <= last_date or news['id'] in seen:
                         continue
-                
-                # 在处理完整个批次后，检查是否需要停止
-                if batch_contained_older_news:
-                    stop_fetching = True
-
-                # --- FIX END ---
-                
-                current_id = min(existing_ids) - 1 if existing_ids else current_id - batch_size
-                
-                # 每5批输出一次进度
-                if batch_count % 5 == 0:
-                    logger.info(f"已处理 {batch_count} 批，找到 {len(all_news)} 篇目标日期文章")
-            
-            # 去重并排序，以防万一有重复ID被加入
-            final_news = {item['id']: item for item in all_news}.values()
-            sorted_news = sorted(list(final_news), key=lambda x: x['id'], reverse=True)
+                    seen.add(news['id'])
+                    yield news
+            finally:
+                # 调用方提前停止时先关闭内层生成器（取消未完成的请求），再关闭会话
+                await news_stream.aclose()
 
-            logger.info(f"高速获取完成，共找到 {len(sorted_news)} 篇 {target_date} 的快讯")
-            return sorted_news
+            logger.info(f"高速获取完成，共找到 {len(seen)} 篇 {date_label} 的快讯")
+        except asyncio.TimeoutError:
+            if not deadline.expired():
+                raise
+            self.partial = True
+            logger.warning(f"已到达截止时间，停止采集 {start_date} ~ {end_date} 的快讯，只返回已获取的部分")
         finally:
             await self.close_browser()
 
+    async def iter_news_by_date(self, target_date: str, search_mode: Optional[str] = None,
+                                deadline=None) -> AsyncIterator[Dict]:
+        """
+        流式获取指定日期的快讯，参数同 get_news_by_date
+        """
+        async for news in self.iter_news_by_range(target_date, target_date, search_mode, deadline):
+            yield news
+
+    async def get_news_by_range(self, start_date: str, end_date: str,
+                                search_mode: Optional[str] = None, deadline=None) -> Dict[str, List[Dict]]:
+        """
+        获取日期区间内的快讯，按日期分组
+        整个区间只发现一次最新ID、遍历一次ID空间，代价与逐日调用 get_news_by_date 相比从平方降为线性
+        Args:
+            start_date: 起始日期 (YYYY-MM-DD)，包含
+            end_date: 结束日期 (YYYY-MM-DD)，包含
+            search_mode: 同 get_news_by_date
+            deadline: 同 iter_news_by_range，到期时返回已获取的部分
+        Returns:
+            {日期: 按ID降序排列的新闻列表}，区间内每一天都有对应的键（可能为空列表）
+        """
+        first_date = datetime.strptime(start_date, "%Y-%m-%d").date()
+        last_date = datetime.strptime(end_date, "%Y-%m-%d").date()
+        buckets = {
+            (first_date + timedelta(days=offset)).strftime("%Y-%m-%d"): []
+            for offset in range((last_date - first_date).days + 1)
+        }
+        async for news in self.iter_news_by_range(start_date, end_date, search_mode, deadline):
+            buckets[self._news_date(news).strftime("%Y-%m-%d")].append(news)
+        for news_list in buckets.values():
+            news_list.sort(key=lambda x: x['id'], reverse=True)
+        return buckets
+
+    async def get_news_by_date(self, target_date: str, search_mode: Optional[str] = None,
+                               deadline=None) -> List[Dict]:
+        """
+        获取指定日期的快讯（高速版本）
+        Args:
+            target_date: 目标日期 (YYYY-MM-DD)
+            search_mode: 'gallop' 倍增+二分定位ID区间后只抓取该区间；
+                         'walk' 从最新ID逐批向下遍历；默认取 AIBASE_CONFIG['search_mode']
+            deadline: 同 iter_news_by_range，到期时返回已获取的部分
+        Returns:
+            按ID降序排列的新闻列表
+        """
+        news_list = [news async for news in self.iter_news_by_date(target_date, search_mode, deadline)]
+        return sorted(news_list, key=lambda x: x['id'], reverse=True)
+
+
+    def _load_follow_cursor(self) -> Optional[int]:
+        return self.index.get_follow_cursor() if self.index else self._follow_cursor
+
+    def _save_follow_cursor(self, news_id: int):
+        self._follow_cursor = news_id
+        if self.index:
+            self.index.set_follow_cursor(news_id)
+
+    async def poll_new_news(self) -> List[Dict]:
+        """
+        轮询一次游标之上新发布的快讯，解析后写入索引（按日期存储），并推进持久化游标
+        首次运行（没有游标）时只把游标设为当前最新ID，从此刻开始跟踪
+        Returns:
+            本次新发现的新闻列表（按ID升序）
+        """
+        await self._ensure_session()
+        cursor = self._load_follow_cursor()
+        if cursor is None:
+            cursor = await self._discover_latest_news_id_fast()
+            if cursor:
+                self._save_follow_cursor(cursor)
+                logger.info(f"持续跟踪模式：游标初始化为最新ID {cursor}")
+            return []
+        
+        window = AIBASE_CONFIG.get('follow_probe_window', 10)
+        results = {}
+        highest = cursor
+        next_id = cursor + 1
+        head = None   # 真实最新ID，遇到空窗口时才查询
+        while True:
+            # 逐窗口向上探测，直到某个窗口内没有任何已发布的文章且已越过真实最新ID
+            probe_ids = list(range(next_id, next_id + window))
+            known = self.index.get_many(probe_ids) if self.index else {}
+            pending_ids = [news_id for news_id in probe_ids if news_id not in known]
+            fetched = await asyncio.gather(*(self._fetch_news(news_id) for news_id in pending_ids))
+            results.update(zip(pending_ids, fetched))
+            found = list(known) + [news_id for news_id, (_, news) in zip(pending_ids, fetched) if news]
+            if found:
+                highest = max(highest, max(found))
+            else:
+                if head is None:
+                    # 空窗口也可能只是比窗口更宽的ID空洞：真实最新ID仍在上方时越过空洞继续探测
+                    known_latest = self.index.get_latest_id() if self.index else None
+                    head = max(known_latest or 0, await self._discover_latest_news_id_fast() or 0)
+                if probe_ids[-1] >= head:
+                    break
+                logger.debug(f"持续跟踪：ID {probe_ids[0]}-{probe_ids[-1]} 为空洞，最新ID为 {head}，继续向上探测")
+            next_id = probe_ids[-1] + 1
+        
+        # 最新ID之上的404只是尚未发布，不能记为不存在
+        settled = {news_id: result for news_id, result in results.items() if news_id <= highest}
+        self._remember_fetch_results(settled)
+        
+        # 超时、429、5xx 等瞬时失败的ID留给下次轮询重试，游标不越过它们
+        retry_ids = [
+            news_id for news_id, (status, news) in settled.items()
+            if not news and (status is None or status == 429 or status >= 500)
+        ]
+        new_cursor = min(retry_ids) - 1 if retry_ids else highest
+        if new_cursor != cursor:
+            self._save_follow_cursor(new_cursor)
+        if self.index and highest > cursor:
+            self.index.set_latest_id(highest)
+        
+        new_news = sorted((news for _, news in settled.values() if news), key=lambda x: x['id'])
+        if new_news or retry_ids:
+            logger.info(f"持续跟踪：新增 {len(new_news)} 条快讯，游标 {cursor} -> {new_cursor}"
+                        + (f"，{len(retry_ids)} 个ID待重试" if retry_ids else ""))
+        return new_news
+
+    async def follow_news(self, interval: Optional[float] = None) -> AsyncIterator[Dict]:
+        """
+        持续跟踪模式：按固定间隔轮询游标之上的新ID，新快讯一经解析即写入索引并产出
+        游标持久化在索引中，重启后从上次位置继续；日报采集时目标日期的快讯已在索引中，几乎不再发请求
+        Args:
+            interval: 轮询间隔（秒），默认取 AIBASE_CONFIG['follow_interval']
+        """
+        interval = interval or AIBASE_CONFIG.get('follow_interval', 60)
+        try:
+            await self.initialize_browser()
+            while True:
+                try:
+                    new_news = await self.poll_new_news()
+                except Exception as e:
+                    # 单次轮询失败不终止跟踪，下次轮询从同一游标重试
+                    logger.error(f"持续跟踪轮询失败: {e}")
+                    new_news = []
+                for news in new_news:
+                    yield news
+                await asyncio.sleep(interval)
+        finally:
+            await self.close_browser()
 
     # 保留原有的辅助方法
     def _parse_publish_time(self, publish_time: str) -> str:
         """解析发布时间为标准格式"""
-        if not publish_time:
-            return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        try:
-            # 优先处理 ISO 格式 (YYYY-MM-DDTHH:MM:SS...)
-            iso_match = re.search(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})', publish_time)
-            if iso_match:
-                return datetime.fromisoformat(iso_match.group(1)).strftime("%Y-%m-%d %H:%M:%S")
-
-            time_formats = [
-                ('%Y年%m月%d日 %H:%M', r'\d{4}年\d{1,2}月\d{1,2}日\s*\d{1,2}:\d{2}'),
-                ('%Y-%m-%d %H:%M', r'\d{4}-\d{2}-\d{2}\s*\d{2}:\d{2}'),
-                ('%Y/%m/%d %H:%M', r'\d{4}/\d{2}/\d{2}\s*\d{2}:\d{2}'),
-                ('%m-%d %H:%M', r'\d{2}-\d{2}\s*\d{2}:\d{2}'),
-                ('%m/%d %H:%M', r'\d{2}/\d{2}\s*\d{2}:\d{2}'),
-            ]
-            
-            for fmt, pattern in time_formats:
-                match = re.search(pattern, publish_time)
-                if match:
-                    time_str = match.group(0)
-                    time_str = re.sub(r'\s+', ' ', time_str).strip()
-                    
-                    try:
-                        dt_obj = datetime.strptime(time_str, fmt)
-                        # 如果年份是1900，说明格式不带年份，需要修正为当前年份
-                        if dt_obj.year == 1900 or fmt in ['%m-%d %H:%M', '%m/%d %H:%M']:
-                            now = datetime.now()
-                            dt_obj = dt_obj.replace(year=now.year)
-                            # 如果解析出的日期比当前日期晚，说明是去年的文章
-                            if dt_obj > now:
-                                dt_obj = dt_obj.replace(year=now.year - 1)
-
-                        return dt_obj.strftime("%Y-%m-%d %H:%M:00")
-                    except ValueError:
-                        continue
-        except:
-            pass
-        
-        # 如果都失败了，返回一个当前时间作为备用
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return parse_publish_time(publish_time)
 
     def _is_decorative_or_related_image(self, src: str, alt: str) -> bool:
         """判断是否为装饰性图片"""
-        decorative_patterns = [
-            r'logo', r'icon', r'avatar', r'banner', r'placeholder',
-            r'loading', r'1x1|1\*1', r'\.gif$', r'ad[s]?[_\-]',
-            r'share|social', r'button|btn', r'data:image/svg',
-            r'thumb|thumbnail', r'small|sm\.', r'list\.|item\.',
-        ]
-        
-        src_lower = src.lower()
-        for pattern in decorative_patterns:
-            if re.search(pattern, src_lower):
-                return True
-        
-        return False
+        return is_decorative_image(src)
 
     def _is_irrelevant_content(self, text: str) -> bool:
         """判断是否为无关内容"""
-        irrelevant_patterns = [
-            r'^阅读原文$', r'^查看更多$', r'^展开.*%$',
-            r'^点击.*查看$', r'^相关.*：$', r'^标签.*：$',
-            r'^分享$', r'^收藏$', r'^点赞$', r'^评论$',
-            r'^\d+$', r'^[<>\/\s]*$',
-        ]
-        
         stripped_text = text.strip()
-        for pattern in irrelevant_patterns:
-            if re.match(pattern, stripped_text, re.IGNORECASE):
-                return True
+        if IRRELEVANT_PATTERN.match(stripped_text):
+            return True
         
         return len(stripped_text) < 10
 
@@ -614,4 +1310,21 @@ class AIBaseNewsScraper:
             # 一个健壮的 close_browser 应该能处理重复关闭。
             # 我已经在 close_browser 中加入了 `if self.session and not self.session.closed:` 判断。
             await self.close_browser()
-        # --- FIX END ---
\ No newline at end of file
+        # --- FIX END ---
+
+
+# 持续跟踪模式: python -m scrapers.aibase_news_scraper
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    async def follow():
+        async for news in AIBaseNewsScraper().follow_news():
+            print(f"[{news['time']}] {news['id']} {news['title']}")
+
+    try:
+        asyncio.run(follow())
+    except KeyboardInterrupt:
+        pass
@@ -6,6 +6,15 @@ import asyncio
 import platform
 import sys
 
+from .concurrency import AdaptiveLimiter
+from .deadline import Deadline
+
+try:
+    from config import Config
+    CRAWLER_CONFIG = Config.CRAWLER_CONFIG
+except ImportError:
+    CRAWLER_CONFIG = {'concurrent_limit': 4}
+
 # 修复Windows下的asyncio问题
 if platform.system() == 'Windows':
     if sys.version_info >= (3, 8):
@@ -36,6 +45,17 @@ class BaseScraper(ABC):
         self.name = name
         self.base_url = base_url
         self.logger = logging.getLogger(f"scraper.{name}")
+        # 自适应并发：详情页延迟平稳时逐步加并发，超时时减半
+        self.limiter = AdaptiveLimiter(
+            initial=CRAWLER_CONFIG.get('concurrent_limit', 4),
+            min_limit=CRAWLER_CONFIG.get('min_concurrent_limit', 1),
+            max_limit=CRAWLER_CONFIG.get('max_concurrent_limit', 8),
+            name=name
+        )
+        # 本次采集的截止时间（由 scrape_articles 设置），子类的请求/页面超时应不超过其剩余时间
+        self.deadline = Deadline()
+        # 本次采集是否因到达截止时间而只返回了部分结果
+        self.partial = False
         
     @abstractmethod
     async def get_article_list(self, start_date: date, end_date: date) -> List[Dict]:
@@ -51,14 +71,63 @@ class BaseScraper(ABC):
         """
         pass
         
+    async def close(self):
+        """释放采集器持有的资源（浏览器等），scrape_articles 结束时自动调用"""
+        pass
+        
+    async def _fetch_article_with_retry(self, article_info: Dict) -> Tuple[Optional[Article], Optional[str]]:
+        """
+        获取单篇文章详情，失败时按 CRAWLER_CONFIG 重试
+        重试次数为 retry_count，第n次重试前等待 delay_between_requests × 2^(n-1) 秒
+        Returns:
+            (文章或None, 最后一次的错误信息或None)
+        """
+        retry_count = CRAWLER_CONFIG.get('retry_count', 0)
+        delay = CRAWLER_CONFIG.get('delay_between_requests', 0)
+        title = article_info.get('title', '未知')
+        error = None
+        for attempt in range(retry_count + 1):
+            if attempt:
+                if self.deadline.expired():
+                    break
+                await asyncio.sleep(self.deadline.cap(delay * 2 ** (attempt - 1)))
+                self.logger.info(f"第 {attempt} 次重试: {title}")
+            async with self.limiter.track() as request:
+                try:
+                    article = await self.get_article_detail(
+                        article_info.get('url', ''), 
+                        article_info.get('date', '')
+                    )
+                    if article:
+                        self.logger.info(f"成功爬取文章: {article.title}")
+                        return article, None
+                    # 子类吞掉异常返回None时，可通过 current_request() 登记状态码或超时
+                    request.failed = True
+                    error = f"无法获取文章详情: {title}"
+                except Exception as e:
+                    request.failed = True
+                    if 'timeout' in type(e).__name__.lower():
+                        request.congestion = 'timeout'
+                    error = f"爬取文章失败 {title}: {str(e)}"
+                    self.logger.warning(error)
+        self.logger.error(error)
+        return None, error
+        
     async def scrape_articles(self, start_date: date, end_date: date, 
-                            progress_callback=None) -> Tuple[List[Article], List[str]]:
+                            progress_callback=None, deadline=None) -> Tuple[List[Article], List[str]]:
         """
         爬取指定日期范围内的文章
+        Args:
+            deadline: 截止时间（Deadline或秒数），到期时取消未完成的详情页请求，
+                      返回已完成的文章并把 self.partial 置为True；None 表示不限时
         返回: (成功的文章列表, 错误信息列表)
         """
         articles = []
         errors = []
+        self.deadline = Deadline.coerce(deadline)
+        self.partial = False
+        results = {}
+        total = 0
         
         try:
             self.logger.info(f"开始爬取 {self.name} 网站文章，日期范围: {start_date} 到 {end_date}")
@@ -70,55 +139,70 @@ class BaseScraper(ABC):
             if progress_callback:
                 progress_callback(f"{self.name}: 找到 {total} 篇文章", 0, total)
             
-            # 使用信号量限制并发数，提高效率
-            semaphore = asyncio.Semaphore(4)  # 最多4个并发
+            # 固定数量的worker从有界队列取任务，按完成顺序实时汇报进度；
+            # 实际同时在途的请求数由自适应限流器控制
+            workers = max(1, min(CRAWLER_CONFIG.get('max_concurrent_limit', 8), total))
+            queue = asyncio.Queue(maxsize=workers * 2)
+            completed = 0
             
-            async def fetch_article(article_info, index):
-                async with semaphore:
+            async def producer():
+                for index, article_info in enumerate(article_list):
+                    await queue.put((index, article_info))
+                for _ in range(workers):
+                    await queue.put(None)
+            
+            async def worker():
+                nonlocal completed
+                while True:
+                    job = await queue.get()
+                    if job is None:
+                        return
+                    index, article_info = job
                     try:
-                        article = await self.get_article_detail(
-                            article_info.get('url', ''), 
-                            article_info.get('date', '')
-                        )
-                        if article:
-                            self.logger.info(f"成功爬取文章: {article.title}")
-                            return article, None
-                        else:
-                            error = f"无法获取文章详情: {article_info.get('title', '未知')}"
-                            return None, error
+                        results[index] = await self._fetch_article_with_retry(article_info)
                     except Exception as e:
-                        error = f"爬取文章失败 {article_info.get('title', '未知')}: {str(e)}"
-                        self.logger.error(error)
-                        return None, error
-            
-            # 使用asyncio.gather并发获取所有文章
-            tasks = [fetch_article(article_info, i) for i, article_info in enumerate(article_list)]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+                        error_msg = f"并发爬取异常: {str(e)}"
+                        self.logger.error(error_msg)
+                        results[index] = (None, error_msg)
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(f"{self.name}: 已处理 {completed}/{total}", completed, total)
             
-            # 处理结果
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    error_msg = f"并发爬取异常: {str(result)}"
-                    self.logger.error(error_msg)
-                    errors.append(error_msg)
-                elif result:
-                    article, error = result
-                    if article:
-                        articles.append(article)
-                    if error:
-                        errors.append(error)
-                        
-                if progress_callback and (i + 1) % 5 == 0:  # 每5个更新一次进度
-                    progress_callback(f"{self.name}: 处理中...", i + 1, len(results))
+            # 到达截止时间时取消所有worker（进行中的请求和页面随之关闭），保留已完成的结果
+            await self.deadline.run(asyncio.gather(producer(), *(worker() for _ in range(workers))))
                     
+        except asyncio.TimeoutError as e:
+            if self.deadline.expired():
+                self.partial = True
+                error_msg = f"{self.name} 已到达截止时间，返回已完成的 {len(results)}/{total} 篇"
+                self.logger.warning(error_msg)
+            else:
+                error_msg = f"{self.name} 爬取过程出现错误: 超时 {e}"
+                self.logger.error(error_msg)
+            errors.append(error_msg)
         except Exception as e:
             error_msg = f"{self.name} 爬取过程出现错误: {str(e)}"
             self.logger.error(error_msg)
             errors.append(error_msg)
+        finally:
+            await self.close()
+        
+        # 结果按列表顺序汇总
+        for index in sorted(results):
+            article, error = results[index]
+            if article:
+                articles.append(article)
+            if error:
+                errors.append(error)
             
-        self.logger.info(f"{self.name} 爬取完成，成功 {len(articles)} 篇，错误 {len(errors)} 个")
+        self.logger.info(f"{self.name} 爬取完成，成功 {len(articles)} 篇，错误 {len(errors)} 个，"
+                         f"并发统计: {self.concurrency_stats()}")
         return articles, errors
         
+    def concurrency_stats(self) -> Dict:
+        """自适应并发统计：当前并发数与详情页延迟分位数"""
+        return self.limiter.stats()
+        
     def is_date_in_range(self, article_date: str, start_date: date, end_date: date) -> bool:
         """检查文章日期是否在指定范围内"""
         try:
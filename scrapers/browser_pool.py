@@ -0,0 +1,166 @@
+"""
+浏览器页面池
+共享一个Chromium进程，维护有上限的预热页面（每个页面独立的BrowserContext），
+借出/归还复用，归还时做健康检查，使用N次后回收重建，避免每篇文章都启动一次浏览器
+"""
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-web-security',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled'
+]
+
+
+class _PooledPage:
+    """池中的一个页面及其所属的上下文和浏览器"""
+
+    def __init__(self, browser, context, page):
+        self.browser = browser
+        self.context = context
+        self.page = page
+        self.uses = 0
+
+
+class BrowserPool:
+    """
+    有界浏览器页面池
+    Args:
+        size: 最多同时存在的页面数（同时也是并发借出上限）
+        max_uses: 单个页面最多使用次数，超过后关闭并重建，防止内存膨胀
+        launch_options: chromium.launch 参数
+        context_options: browser.new_context 参数（如 user_agent）
+    """
+
+    def __init__(self, size: int = 4, max_uses: int = 20,
+                 launch_options: Optional[Dict] = None, context_options: Optional[Dict] = None):
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.launch_options = launch_options or {'headless': True, 'args': DEFAULT_LAUNCH_ARGS}
+        self.context_options = context_options or {}
+        self._page_hooks: List[Callable[[Any], Awaitable[None]]] = []
+        self._playwright = None
+        self._browser = None
+        self._idle = deque()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._stats = {
+            'browser_launches': 0,
+            'pages_created': 0,
+            'pages_recycled': 0,
+            'unhealthy_pages': 0,
+            'checkouts': 0,
+        }
+
+    def add_page_hook(self, hook: Callable[[Any], Awaitable[None]]):
+        """注册新页面创建后执行的初始化协程（如设置请求拦截）"""
+        self._page_hooks.append(hook)
+
+    async def _ensure_browser(self):
+        """按需启动（或在断开后重启）浏览器"""
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            if self._browser is not None:
+                logger.warning("浏览器连接已断开，重新启动")
+                self._idle.clear()
+            # 延迟导入，未使用浏览器的流程不加载playwright
+            from playwright.async_api import async_playwright
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(**self.launch_options)
+            self._stats['browser_launches'] += 1
+            return self._browser
+
+    async def _new_page(self) -> _PooledPage:
+        browser = await self._ensure_browser()
+        context = await browser.new_context(**self.context_options)
+        page = await context.new_page()
+        for hook in self._page_hooks:
+            await hook(page)
+        self._stats['pages_created'] += 1
+        return _PooledPage(browser, context, page)
+
+    def _is_healthy(self, item: _PooledPage) -> bool:
+        return (
+            item.browser is self._browser
+            and self._browser is not None
+            and self._browser.is_connected()
+            and not item.page.is_closed()
+        )
+
+    async def _discard(self, item: _PooledPage):
+        try:
+            await item.context.close()
+        except Exception as e:
+            logger.debug(f"关闭页面上下文失败: {e}")
+
+    @asynccontextmanager
+    async def page(self):
+        """
+        借出一个页面，用完自动归还:
+            async with pool.page() as page:
+                await page.goto(url)
+        使用过程中抛出异常的页面不再归还，直接关闭重建
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        async with self._slots:
+            item = None
+            while self._idle and item is None:
+                candidate = self._idle.popleft()
+                if self._is_healthy(candidate):
+                    item = candidate
+                else:
+                    self._stats['unhealthy_pages'] += 1
+                    await self._discard(candidate)
+            if item is None:
+                item = await self._new_page()
+            item.uses += 1
+            self._stats['checkouts'] += 1
+
+            reusable = False
+            try:
+                yield item.page
+                reusable = True
+            finally:
+                if reusable and self._is_healthy(item) and item.uses < self.max_uses:
+                    self._idle.append(item)
+                else:
+                    if item.uses >= self.max_uses:
+                        self._stats['pages_recycled'] += 1
+                    elif reusable:
+                        self._stats['unhealthy_pages'] += 1
+                    await self._discard(item)
+
+    def stats(self) -> Dict:
+        """页面池统计：启动次数、页面创建/回收数、借出次数"""
+        return dict(self._stats, size=self.size, idle_pages=len(self._idle))
+
+    async def close(self):
+        """关闭所有页面、浏览器和playwright驱动；再次借出时会重新启动"""
+        while self._idle:
+            await self._discard(self._idle.popleft())
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.debug(f"关闭浏览器失败: {e}")
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+        # 信号量和锁绑定在创建它们的事件循环上，下次使用时重新创建
+        self._slots = None
+        self._launch_lock = None
@@ -0,0 +1,184 @@
+"""
+自适应并发控制
+AIMD（加性增、乘性减）限流器：延迟平稳且成功率高时逐步提高并发，
+遇到超时、429、5xx 时成倍降低并发
+"""
+import asyncio
+import contextvars
+import logging
+import time
+from collections import deque
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 当前任务中正在跟踪的请求，供不直接持有跟踪对象的下层代码（如详情页抓取）登记状态码和超时
+_current_request: contextvars.ContextVar[Optional['_TrackedRequest']] = \
+    contextvars.ContextVar('current_request', default=None)
+
+
+def current_request() -> Optional['_TrackedRequest']:
+    """当前任务中 limiter.track() 范围内的请求，不在范围内时返回None"""
+    return _current_request.get()
+
+
+class _TrackedRequest:
+    """一次受限流器管理的请求，调用方在其中登记HTTP状态码或拥塞原因"""
+
+    def __init__(self, limiter: 'AdaptiveLimiter'):
+        self.limiter = limiter
+        self.status: Optional[int] = None
+        self.congestion: Optional[str] = None   # 非HTTP请求（如浏览器页面）可直接登记拥塞原因
+        self.failed = False   # 请求失败但不属于拥塞（如解析不出内容），不计为成功
+        self.started = 0.0
+        self.excluded = 0.0   # 不计入延迟的本地等待时间（如排队借用浏览器页面）
+        self._token = None
+
+    async def __aenter__(self):
+        await self.limiter.acquire()
+        self.started = time.perf_counter()
+        self._token = _current_request.set(self)
+        return self
+
+    def exclude(self, seconds: float):
+        """从本次请求的延迟中扣除本地排队等待的时间，避免排队被当作服务端变慢"""
+        self.excluded += max(0.0, seconds)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        latency = time.perf_counter() - self.started - self.excluded
+        _current_request.reset(self._token)
+        try:
+            if exc_type is not None and issubclass(exc_type, asyncio.TimeoutError):
+                self.limiter.on_congestion('timeout')
+            elif self.congestion:
+                self.limiter.on_congestion(self.congestion)
+            elif self.status == 429 or (self.status is not None and self.status >= 500):
+                self.limiter.on_congestion(f"HTTP {self.status}")
+            elif exc_type is None and not self.failed:
+                self.limiter.on_success(latency)
+        finally:
+            self.limiter.release()
+        return False
+
+
+class AdaptiveLimiter:
+    """
+    AIMD并发限流器
+    Args:
+        initial: 初始并发数
+        min_limit: 并发下限
+        max_limit: 并发上限
+        latency_tolerance: 近期延迟中位数不超过 基线延迟×该倍数 时才允许加并发
+        decrease_factor: 拥塞时的并发乘数
+        name: 日志中显示的名称
+    """
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 32,
+                 latency_tolerance: float = 2.0, decrease_factor: float = 0.5, name: str = ""):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(max(initial, self.min_limit), self.max_limit)
+        self.latency_tolerance = latency_tolerance
+        self.decrease_factor = decrease_factor
+        self.name = name
+        self.in_flight = 0
+        self._waiters = deque()
+        self._latencies = deque(maxlen=500)
+        self._window = deque(maxlen=20)      # 本次加并发判断使用的近期延迟
+        self._baseline: Optional[float] = None
+        self._successes_since_change = 0
+        self._last_decrease = 0.0
+        self._counts = {'success': 0, 'congestion': 0}
+
+    async def acquire(self):
+        """等待直到在途请求数低于当前并发上限；按先来后到分配槽位，避免新请求插队饿死等待者"""
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # 槽位由 _wake_waiters 直接计入并移交给本等待者
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 已分到槽位却被取消时，把槽位让给下一个等待者
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self):
+        self.in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self):
+        """按空闲槽位数依次唤醒等待者，并直接为其占用槽位"""
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def track(self) -> _TrackedRequest:
+        """
+        获取一个并发槽位并跟踪请求结果:
+            async with limiter.track() as request:
+                ...
+                request.status = response.status
+        """
+        return _TrackedRequest(self)
+
+    def on_success(self, latency: float):
+        """请求成功：记录延迟，每完成约一个窗口（当前并发数）的请求评估一次是否加并发"""
+        self._counts['success'] += 1
+        self._latencies.append(latency)
+        self._window.append(latency)
+        self._successes_since_change += 1
+        if self._successes_since_change < self.limit:
+            return
+
+        recent = sorted(self._window)[len(self._window) // 2]
+        if self._baseline is None or recent < self._baseline:
+            self._baseline = recent
+        else:
+            # 基线缓慢上浮，适应网络状况的长期变化
+            self._baseline = self._baseline * 0.95 + recent * 0.05
+        self._successes_since_change = 0
+        if recent <= self._baseline * self.latency_tolerance and self.limit < self.max_limit:
+            self.limit += 1
+            logger.debug(f"{self.name} 延迟平稳（{recent * 1000:.0f}ms），并发提高到 {self.limit}")
+            self._wake_waiters()
+
+    def on_congestion(self, reason: str):
+        """超时、429、5xx：成倍降低并发；同一波拥塞（约一个RTT内）只降一次"""
+        self._counts['congestion'] += 1
+        now = time.monotonic()
+        cooldown = self._baseline * 2 if self._baseline else 1.0
+        if now - self._last_decrease < max(cooldown, 0.5):
+            return
+        self._last_decrease = now
+        self._successes_since_change = 0
+        new_limit = max(self.min_limit, int(self.limit * self.decrease_factor))
+        if new_limit != self.limit:
+            logger.info(f"{self.name} 遇到 {reason}，并发从 {self.limit} 降到 {new_limit}")
+            self.limit = new_limit
+
+    def stats(self) -> Dict:
+        """当前并发上限与延迟分位数"""
+        latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 1)
+
+        return {
+            'limit': self.limit,
+            'in_flight': self.in_flight,
+            'latency_ms_p50': percentile(0.5),
+            'latency_ms_p90': percentile(0.9),
+            'latency_ms_p99': percentile(0.99),
+            'successes': self._counts['success'],
+            'congestion_events': self._counts['congestion'],
+        }
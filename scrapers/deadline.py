@@ -0,0 +1,68 @@
+"""
+采集截止时间
+整个采集共享一个截止时间：单次请求/页面操作的超时不超过剩余时间，
+到期时取消仍在进行的工作，调用方返回已采集到的部分结果并标记为不完整
+"""
+import asyncio
+import time
+from typing import Awaitable, Optional, TypeVar, Union
+
+T = TypeVar('T')
+
+
+class Deadline:
+    """
+    截止时间
+    Args:
+        seconds: 从现在起的时间预算（秒），None 表示不限时
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.seconds = seconds
+        self._at = None if seconds is None else time.monotonic() + max(0.0, seconds)
+        self._reached = False   # run() 因到期而取消过等待（事件循环定时器可能略早于时钟触发）
+
+    @classmethod
+    def coerce(cls, value: Union['Deadline', float, int, None]) -> 'Deadline':
+        """接受 Deadline、秒数或 None"""
+        if isinstance(value, Deadline):
+            return value
+        return cls(None if value is None else float(value))
+
+    @property
+    def unlimited(self) -> bool:
+        return self._at is None
+
+    def remaining(self) -> Optional[float]:
+        """剩余秒数，不限时返回None"""
+        if self._at is None:
+            return None
+        return max(0.0, self._at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self._reached or (self._at is not None and time.monotonic() >= self._at)
+
+    def cap(self, timeout: float) -> float:
+        """把单次操作的超时（秒）限制在剩余时间以内"""
+        remaining = self.remaining()
+        return timeout if remaining is None else max(0.001, min(timeout, remaining))
+
+    def cap_ms(self, timeout_ms: int) -> int:
+        """同 cap，单位为毫秒（Playwright超时参数）"""
+        return max(1, int(self.cap(timeout_ms / 1000) * 1000))
+
+    async def run(self, awaitable: Awaitable[T]) -> T:
+        """
+        在剩余时间内等待，到期时取消并抛出 asyncio.TimeoutError
+        """
+        if self._at is None:
+            return await awaitable
+        try:
+            return await asyncio.wait_for(awaitable, self.remaining())
+        except asyncio.TimeoutError:
+            self._reached = True
+            raise
+
+    def __repr__(self):
+        remaining = self.remaining()
+        return "Deadline(unlimited)" if remaining is None else f"Deadline(remaining={remaining:.1f}s)"
@@ -0,0 +1,135 @@
+"""
+页面就绪等待
+用选择器出现、DOM变更静默、字体加载完成、网络静默等条件代替固定时长的 wait_for_timeout，
+页面一就绪立即返回，每个条件都有超时上限，超时后按已就绪处理而不抛异常
+"""
+import asyncio
+import logging
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 在页面内等待：连续 quietMs 毫秒没有DOM变更即返回，最长等待 timeoutMs 毫秒
+DOM_QUIET_JS = """
+({quietMs, timeoutMs}) => new Promise(resolve => {
+    let quietTimer = null;
+    const finish = () => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadline);
+        resolve(true);
+    };
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(finish, quietMs);
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+    quietTimer = setTimeout(finish, quietMs);
+    const deadline = setTimeout(finish, timeoutMs);
+})
+"""
+
+FONTS_READY_JS = """
+(timeoutMs) => Promise.race([
+    document.fonts ? document.fonts.ready.then(() => true) : Promise.resolve(true),
+    new Promise(resolve => setTimeout(() => resolve(false), timeoutMs))
+])
+"""
+
+
+async def wait_for_any_selector(page, selectors: Iterable[str], timeout: int = 5000) -> bool:
+    """
+    等待任一选择器匹配的元素出现
+    Returns:
+        是否在超时前出现
+    """
+    try:
+        await page.wait_for_selector(", ".join(selectors), state="attached", timeout=timeout)
+        return True
+    except Exception as e:
+        logger.debug(f"等待选择器超时: {e}")
+        return False
+
+
+async def wait_for_dom_quiet(page, quiet_ms: int = 300, timeout: int = 3000) -> bool:
+    """等待DOM在 quiet_ms 毫秒内不再变化（页面脚本渲染完成）"""
+    try:
+        return await page.evaluate(DOM_QUIET_JS, {'quietMs': quiet_ms, 'timeoutMs': timeout})
+    except Exception as e:
+        logger.debug(f"等待DOM静默失败: {e}")
+        return False
+
+
+async def wait_for_fonts(page, timeout: int = 3000) -> bool:
+    """等待 document.fonts.ready（网页字体加载完成）"""
+    try:
+        return await page.evaluate(FONTS_READY_JS, timeout)
+    except Exception as e:
+        logger.debug(f"等待字体加载失败: {e}")
+        return False
+
+
+async def wait_for_network_quiet(page, quiet_ms: int = 500, timeout: int = 5000,
+                                 resource_types: Optional[Iterable[str]] = None) -> bool:
+    """
+    等待网络静默：在途请求数归零并保持 quiet_ms 毫秒（如滚动触发的信息流XHR加载完成）
+    只统计调用之后发出的请求；与 networkidle 不同，导航完成后仍可反复使用
+    Args:
+        resource_types: 只统计这些资源类型的请求（如 ('xhr', 'fetch')），None 表示全部
+    Returns:
+        是否在超时前静默
+    """
+    loop = asyncio.get_running_loop()
+    types = None if resource_types is None else set(resource_types)
+    in_flight = set()
+    changed = asyncio.Event()
+
+    def on_request(request):
+        if types is None or request.resource_type in types:
+            in_flight.add(request)
+            changed.set()
+
+    def on_done(request):
+        if request in in_flight:
+            in_flight.discard(request)
+            changed.set()
+
+    page.on("request", on_request)
+    page.on("requestfinished", on_done)
+    page.on("requestfailed", on_done)
+    deadline = loop.time() + timeout / 1000
+    try:
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logger.debug(f"等待网络静默超时，仍有 {len(in_flight)} 个请求未完成")
+                return False
+            changed.clear()
+            # 没有在途请求时只需再等 quiet_ms；有在途请求时等到其完成
+            wait = remaining if in_flight else min(quiet_ms / 1000, remaining)
+            try:
+                await asyncio.wait_for(changed.wait(), wait)
+            except asyncio.TimeoutError:
+                if not in_flight and wait >= quiet_ms / 1000:
+                    return True
+    finally:
+        page.remove_listener("request", on_request)
+        page.remove_listener("requestfinished", on_done)
+        page.remove_listener("requestfailed", on_done)
+
+
+async def wait_for_growth(page, expression: str, previous, timeout: int = 3000) -> bool:
+    """
+    等待页面内表达式的值超过 previous（如滚动后 document.body.scrollHeight 增长）
+    Args:
+        expression: 返回数值的JS表达式
+        previous: 原值
+    Returns:
+        是否在超时前增长
+    """
+    try:
+        await page.wait_for_function(f"previous => ({expression}) > previous", arg=previous, timeout=timeout)
+        return True
+    except Exception as e:
+        logger.debug(f"等待页面增长超时: {e}")
+        return False
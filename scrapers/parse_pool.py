@@ -0,0 +1,117 @@
+"""
+页面解析工作池
+把CPU密集的HTML解析从事件循环中移到线程池/进程池执行，
+并用有界队列在抓取与解析之间做背压，同时统计队列深度和解析耗时
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _timed_call(func: Callable, *args):
+    """在工作线程/进程内执行并计时，返回 (结果, 纯解析耗时秒)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+class ParsePool:
+    """
+    有界解析工作池
+    Args:
+        mode: 'thread' 线程池；'process' 进程池（可利用多核，解析函数及参数需可pickle）；
+              'inline' 直接在事件循环中解析（与原行为一致）
+        workers: 工作线程/进程数
+        queue_size: 最多同时排队+执行的解析任务数，满了之后抓取方会等待（背压）
+    """
+
+    def __init__(self, mode: str = 'thread', workers: int = 2, queue_size: int = 16):
+        if mode not in ('thread', 'process', 'inline'):
+            raise ValueError(f"不支持的解析池模式: {mode}")
+        self.mode = mode
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._depth = 0
+        self._max_depth = 0
+        self._submitted = 0
+        self._waited = 0
+        self._latencies = deque(maxlen=1000)   # 最近的纯解析耗时（秒）
+        self._turnarounds = deque(maxlen=1000)  # 最近的提交到完成耗时（含排队，秒）
+
+    def _ensure_executor(self) -> Optional[Executor]:
+        if self.mode == 'inline':
+            return None
+        if self._executor is None:
+            if self.mode == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='parse')
+        return self._executor
+
+    async def run(self, func: Callable, *args) -> Any:
+        """
+        提交一个解析任务并等待结果
+        队列已满时在此等待，从而让抓取速度跟上解析速度
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.queue_size)
+        if self._slots.locked():
+            self._waited += 1
+
+        async with self._slots:
+            self._depth += 1
+            self._submitted += 1
+            self._max_depth = max(self._max_depth, self._depth)
+            start = time.perf_counter()
+            try:
+                executor = self._ensure_executor()
+                if executor is None:
+                    result, elapsed = _timed_call(func, *args)
+                else:
+                    result, elapsed = await asyncio.get_running_loop().run_in_executor(
+                        executor, _timed_call, func, *args
+                    )
+                self._latencies.append(elapsed)
+                return result
+            finally:
+                self._turnarounds.append(time.perf_counter() - start)
+                self._depth -= 1
+
+    def stats(self) -> Dict:
+        """队列深度与解析耗时统计，用于确定工作池大小"""
+        latencies = sorted(self._latencies)
+        turnarounds = sorted(self._turnarounds)
+
+        def percentile(values, p: float) -> float:
+            if not values:
+                return 0.0
+            return round(values[min(len(values) - 1, int(len(values) * p))] * 1000, 2)
+
+        return {
+            'mode': self.mode,
+            'workers': self.workers,
+            'queue_size': self.queue_size,
+            'queue_depth': self._depth,
+            'max_queue_depth': self._max_depth,
+            'submitted': self._submitted,
+            'backpressure_waits': self._waited,
+            'parse_ms_avg': round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+            'parse_ms_p50': percentile(latencies, 0.5),
+            'parse_ms_p95': percentile(latencies, 0.95),
+            'turnaround_ms_p95': percentile(turnarounds, 0.95),
+        }
+
+    def shutdown(self):
+        """关闭执行器（不等待正在执行的任务）；再次使用时会重新创建"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        # 信号量绑定在创建它的事件循环上，下次使用时重新创建
+        self._slots = None
@@ -0,0 +1,127 @@
+"""
+页面资源拦截
+通过Playwright请求路由按资源类型和域名黑名单中止不需要的请求（图片、视频、字体、广告、统计脚本），
+并统计拦截的请求数与节省的流量
+"""
+import logging
+from collections import Counter
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = ['image', 'media', 'font']
+DEFAULT_BLOCKED_DOMAINS = [
+    'hm.baidu.com',
+    'pos.baidu.com',
+    'cpro.baidu.com',
+    'cnzz.com',
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'mmstat.com',
+    'tanx.com',
+    'ad.sohu.com',
+    'go.sohu.com',
+    'pv.sohu.com',
+]
+# 被拦截的资源从不加载，无法观测其大小：按类型使用典型大小（字节）估算节省的流量
+DEFAULT_SIZE_ESTIMATES = {
+    'image': 50 * 1024,
+    'media': 1024 * 1024,
+    'font': 40 * 1024,
+    'stylesheet': 20 * 1024,
+    'script': 30 * 1024,
+}
+
+
+class ResourceBlocker:
+    """
+    按资源类型/域名中止请求的路由过滤器
+    Args:
+        resource_types: 需要拦截的资源类型（Playwright resource_type，如 image、media、font、stylesheet）
+        domains: 需要拦截的域名（同时匹配其子域名）
+        size_estimates: 资源类型 -> 单个请求的估算大小（字节），用于估算节省的流量
+    """
+
+    def __init__(self, resource_types: Optional[Iterable[str]] = None, domains: Optional[Iterable[str]] = None,
+                 size_estimates: Optional[Dict[str, int]] = None):
+        self.resource_types = set(DEFAULT_BLOCKED_RESOURCE_TYPES if resource_types is None else resource_types)
+        self.domains = tuple(d.lower().lstrip('.') for d in (DEFAULT_BLOCKED_DOMAINS if domains is None else domains))
+        self.size_estimates = dict(DEFAULT_SIZE_ESTIMATES if size_estimates is None else size_estimates)
+        self.reset()
+
+    def reset(self):
+        """清空统计"""
+        self._blocked = Counter()                 # 资源类型 -> 拦截次数
+        self._loaded = Counter()                  # 资源类型 -> 放行次数
+        self._loaded_bytes = Counter()            # 资源类型 -> 已知大小的响应字节数
+        self._sized = Counter()                   # 资源类型 -> 带 Content-Length 的响应数
+
+    def snapshot(self) -> Dict[str, Counter]:
+        """
+        当前累计计数的副本
+        拦截器在多次（可能并行的）采集间共享时，每次采集开始时取快照、结束时用 stats(since=快照)
+        得到本次采集期间的增量，而不是清空共享计数
+        """
+        return {
+            'blocked': Counter(self._blocked),
+            'loaded': Counter(self._loaded),
+            'loaded_bytes': Counter(self._loaded_bytes),
+            'sized': Counter(self._sized),
+        }
+
+    def _is_blocked_domain(self, url: str) -> bool:
+        host = (urlparse(url).hostname or '').lower()
+        return any(host == domain or host.endswith('.' + domain) for domain in self.domains)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """判断请求是否应被拦截"""
+        return resource_type in self.resource_types or self._is_blocked_domain(url)
+
+    async def attach(self, page):
+        """在页面上安装路由过滤和流量统计，可作为 BrowserPool 的页面初始化钩子"""
+        await page.route("**/*", self._handle_route)
+        page.on("response", self._on_response)
+
+    async def _handle_route(self, route):
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self._blocked[request.resource_type] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _on_response(self, response):
+        resource_type = response.request.resource_type
+        self._loaded[resource_type] += 1
+        length = response.headers.get('content-length')
+        if length and length.isdigit():
+            self._loaded_bytes[resource_type] += int(length)
+            self._sized[resource_type] += 1
+
+    def stats(self, since: Optional[Dict[str, Counter]] = None) -> Dict:
+        """
+        拦截统计
+        节省流量优先按同类型已放行响应的平均大小估算（如按域名拦截的脚本）；
+        图片、视频、字体等整类拦截的资源从不加载，按 size_estimates 中的典型大小估算，两者都没有的不计入
+        Args:
+            since: snapshot() 的返回值，给出时只统计快照之后的增量（并行采集共用拦截器时包含其他采集的请求）
+        """
+        current = self.snapshot()
+        if since:
+            current = {key: counter - since.get(key, Counter()) for key, counter in current.items()}
+        blocked, loaded_bytes, sized = current['blocked'], current['loaded_bytes'], current['sized']
+        saved_bytes = 0
+        for resource_type, count in blocked.items():
+            if sized[resource_type]:
+                saved_bytes += count * loaded_bytes[resource_type] // sized[resource_type]
+            else:
+                saved_bytes += count * self.size_estimates.get(resource_type, 0)
+        return {
+            'requests_blocked': sum(blocked.values()),
+            'blocked_by_type': dict(blocked),
+            'requests_loaded': sum(current['loaded'].values()),
+            'bytes_loaded': sum(loaded_bytes.values()),
+            'bytes_saved_estimate': saved_bytes,
+        }
@@ -1,126 +1,447 @@
-from datetime import date
-from typing import List, Dict, Optional
-from playwright.async_api import async_playwright, Page, Browser
+from datetime import date, datetime, timedelta
+from typing import Any, List, Dict, Optional, Tuple
 import asyncio
+import aiohttp
+import json
 import re
-from .base_scraper import BaseScraper, Article
+import time
+from .base_scraper import BaseScraper, Article, CRAWLER_CONFIG
+from .browser_pool import BrowserPool, DEFAULT_LAUNCH_ARGS
+from .resource_filter import ResourceBlocker
+from .parse_pool import ParsePool
+from .concurrency import current_request
+from .page_waits import wait_for_any_selector, wait_for_dom_quiet, wait_for_growth, wait_for_network_quiet
 
-class SohuScraper(BaseScraper):
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# 列表页文章链接选择器 - 按顺序尝试，同一链接只取第一次出现
+ARTICLE_SELECTORS = [
+    "div.feed-item-content a",
+    "div[class*='item'] a[href*='/a/']",
+    ".article-item a",
+    "a[href*='/a/'][title]",
+    "div.list-item a",
+    "article a",
+    ".content-list a",
+    "[class*='article'] a",
+    "[class*='news'] a",
+    "a[href*='sohu.com/a/']",
+    "h3 a",
+    "h4 a",
+    ".title a"
+]
+
+# 文章详情页选择器（HTTP解析与浏览器渲染两条路径共用，按顺序尝试）
+TITLE_SELECTORS = [
+    "h1",
+    "[class*='title']",
+    ".article-title",
+    ".content-title"
+]
+
+# 获取文章内容 - 针对搜狐页面结构优化
+CONTENT_SELECTORS = [
+    ".text",  # 搜狐文章主要内容
+    "[class*='content']",
+    "[class*='article-body']",
+    ".article-content",
+    "article",
+    "[id*='content']",
+    ".text-content",  # 搜狐可能的内容区域
+]
+
+DATE_SELECTORS = [
+    "[class*='time']",
+    "[class*='date']",
+    ".publish-time",
+    ".article-date"
+]
+
+MIN_CONTENT_LENGTH = 100  # 正文超过该长度才视为获取到有意义的内容
+
+# 在页面内一次性提取全部候选链接（href、标题、父元素内的日期文本），避免逐个元素往返浏览器
+LIST_EXTRACT_JS = """
+(selectors) => {
+    const seen = new Set();
+    const items = [];
+    for (const selector of selectors) {
+        let links;
+        try {
+            links = document.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        for (const link of links) {
+            const href = link.getAttribute('href');
+            if (!href || seen.has(href)) continue;
+            seen.add(href);
+            const parent = link.parentElement;
+            const dateElem = parent ? parent.querySelector("[class*='time'], [class*='date'], span") : null;
+            items.push({
+                href: href,
+                title: link.getAttribute('title') || link.textContent || '',
+                dateText: dateElem ? (dateElem.textContent || '') : ''
+            });
+        }
+    }
+    return items;
+}
+"""
+
+# 在页面内按与 parse_article_html 相同的选择器逻辑一次性提取标题、正文和日期文本
+DETAIL_EXTRACT_JS = """
+({titleSelectors, contentSelectors, dateSelectors, minLength}) => {
+    const first = (selector) => {
+        try {
+            return document.querySelector(selector);
+        } catch (e) {
+            return null;
+        }
+    };
+    let title = '';
+    for (const selector of titleSelectors) {
+        const element = first(selector);
+        if (element) {
+            title = element.textContent || '';
+            if (title.trim()) break;
+        }
+    }
+    let content = '';
+    for (const selector of contentSelectors) {
+        const element = first(selector);
+        if (!element) continue;
+        const paragraphs = element.querySelectorAll('p, div');
+        if (paragraphs.length) {
+            const parts = [];
+            for (const paragraph of paragraphs) {
+                const text = (paragraph.textContent || '').trim();
+                if (text.length > 10) parts.push(text);
+            }
+            content = parts.join('\\n\\n');
+        } else {
+            content = element.textContent || '';
+        }
+        if (content.trim().length > minLength) break;
+    }
+    const dateTexts = [];
+    for (const selector of dateSelectors) {
+        const element = first(selector);
+        if (element) dateTexts.push(element.textContent || '');
+    }
+    return {title: title, content: content, dateTexts: dateTexts};
+}
+"""
+
+
+# 信息流JSON中条目字段的常见键名
+FEED_URL_KEYS = ('url', 'link', 'href', 'mobileUrl', 'murl', 'pcUrl', 'articleUrl')
+FEED_TIME_KEYS = ('publicTime', 'publishTime', 'postTime', 'pubTime', 'createTime', 'ctime', 'time', 'date')
+
+
+def _format_feed_time(value: Any) -> str:
+    """把信息流中的时间（毫秒/秒时间戳或日期文本）转换为日期文本"""
+    if isinstance(value, str) and value.isdigit():
+        value = int(value)
+    if isinstance(value, (int, float)) and value > 0:
+        timestamp = value / 1000 if value > 1e12 else value
+        try:
+            return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+        except (OverflowError, OSError, ValueError):
+            return ""
+    return value if isinstance(value, str) else ""
+
+
+def extract_feed_items(payload: Any) -> List[Dict]:
+    """
+    从信息流接口返回的JSON中递归提取文章条目
+    凡是同时带有标题和文章链接（含 /a/）的对象都视为一条文章，不依赖具体的接口结构
+    Returns:
+        [{'href', 'title', 'dateText'}]，格式与 LIST_EXTRACT_JS 的结果一致
+    """
+    items = []
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+        title = node.get('title')
+        url = next((node[key] for key in FEED_URL_KEYS if isinstance(node.get(key), str)), None)
+        if isinstance(title, str) and url and '/a/' in url:
+            if url.startswith('//'):
+                url = 'https:' + url
+            time_value = next((node[key] for key in FEED_TIME_KEYS if node.get(key)), "")
+            items.append({'href': url, 'title': title, 'dateText': _format_feed_time(time_value)})
+        stack.extend(reversed([value for value in node.values() if isinstance(value, (dict, list))]))
+    return items
+
+
+def _loads_json_or_jsonp(text: str) -> Any:
+    """解析JSON或JSONP（callback({...})）响应体"""
+    text = text.strip()
+    if text and text[0] not in '[{':
+        start = min((i for i in (text.find('{'), text.find('[')) if i >= 0), default=-1)
+        end = max(text.rfind('}'), text.rfind(']'))
+        if start < 0 or end < start:
+            raise ValueError("不是JSON/JSONP")
+        text = text[start:end + 1]
+    return json.loads(text)
+
+
+class _FeedCapture:
+    """收集列表页后台请求（XHR/fetch）返回的JSON，从中提取信息流条目"""
+    
     def __init__(self):
+        self._responses = []
+        self.feed_items = 0
+    
+    def on_response(self, response):
+        content_type = response.headers.get('content-type', '')
+        if response.request.resource_type in ('xhr', 'fetch') and ('json' in content_type or 'javascript' in content_type):
+            self._responses.append(response)
+    
+    async def drain_items(self) -> List[Dict]:
+        """解析自上次调用以来捕获的响应，返回其中的文章条目"""
+        responses, self._responses = self._responses, []
+        items = []
+        for response in responses:
+            try:
+                items.extend(extract_feed_items(_loads_json_or_jsonp(await response.text())))
+            except Exception:
+                continue
+        self.feed_items += len(items)
+        return items
+
+
+def parse_article_html(html: str) -> Tuple[str, str, List[str]]:
+    """
+    用与浏览器路径相同的选择器逻辑解析文章详情页的初始HTML
+    纯函数，可在解析线程池中执行
+    Args:
+        html: 页面HTML
+    Returns:
+        (标题, 正文, 各日期选择器首个匹配元素的文本)
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    title = ""
+    for selector in TITLE_SELECTORS:
+        element = soup.select_one(selector)
+        if element:
+            title = element.get_text()
+            if title and title.strip():
+                break
+    
+    content = ""
+    for selector in CONTENT_SELECTORS:
+        element = soup.select_one(selector)
+        if not element:
+            continue
+        # 获取纯文本内容，但保持段落结构
+        paragraphs = element.select("p, div")
+        if paragraphs:
+            content_parts = []
+            for paragraph in paragraphs:
+                p_text = paragraph.get_text()
+                if p_text and p_text.strip() and len(p_text.strip()) > 10:
+                    content_parts.append(p_text.strip())
+            content = "\n\n".join(content_parts)
+        else:
+            content = element.get_text()
+        if content and len(content.strip()) > MIN_CONTENT_LENGTH:
+            break
+    
+    date_texts = []
+    for selector in DATE_SELECTORS:
+        element = soup.select_one(selector)
+        if element:
+            date_texts.append(element.get_text())
+    return title, content, date_texts
+
+
+def create_browser_pool() -> Tuple[BrowserPool, Optional[ResourceBlocker]]:
+    """
+    按 CRAWLER_CONFIG 创建搜狐页面池，并按配置安装资源拦截
+    Returns:
+        (页面池, 资源拦截器；未启用拦截时为None)
+    """
+    pool = BrowserPool(
+        size=CRAWLER_CONFIG.get('browser_pool_size', 4),
+        max_uses=CRAWLER_CONFIG.get('page_max_uses', 20),
+        launch_options={'headless': True, 'args': DEFAULT_LAUNCH_ARGS},
+        context_options={'user_agent': USER_AGENT}
+    )
+    # 拦截图片、视频、字体及广告统计请求，只加载正文相关资源
+    blocker = None
+    if CRAWLER_CONFIG.get('block_resources', True):
+        blocker = ResourceBlocker(
+            resource_types=CRAWLER_CONFIG.get('blocked_resource_types'),
+            domains=CRAWLER_CONFIG.get('blocked_domains'),
+            size_estimates=CRAWLER_CONFIG.get('blocked_size_estimates')
+        )
+        pool.add_page_hook(blocker.attach)
+    return pool, blocker
+
+
+def create_session() -> aiohttp.ClientSession:
+    """创建搜狐详情页HTTP会话（需在事件循环内调用）"""
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=CRAWLER_CONFIG.get('request_timeout', 30), connect=5),
+        headers={'User-Agent': USER_AGENT}
+    )
+
+
+class SohuScraper(BaseScraper):
+    def __init__(self, browser_pool: Optional[BrowserPool] = None,
+                 session: Optional[aiohttp.ClientSession] = None,
+                 resource_blocker: Optional[ResourceBlocker] = None):
+        """
+        Args:
+            browser_pool: 外部共享的页面池（如常驻事件循环上的预热页面池），采集结束时不关闭；
+                          为None时自建页面池，采集结束时关闭浏览器
+            session: 外部共享的HTTP会话，规则同 browser_pool
+            resource_blocker: 外部页面池上安装的资源拦截器（见 create_browser_pool），
+                              采集结束时输出本次采集期间的统计增量；自建页面池时忽略
+        """
         super().__init__(
             name="腾讯研究院AI速递",
             base_url="https://mp.sohu.com/profile?xpt=bGl1amluc29uZzIwMDBAMTI2LmNvbQ=="
         )
         self.source_weight = 8  # 权重分数
+        # 预热页面池：整个采集过程只启动一次Chromium，页面借出/归还复用
+        self._owns_browser_pool = browser_pool is None
+        self.resource_blocker = resource_blocker
+        if browser_pool is None:
+            browser_pool, self.resource_blocker = create_browser_pool()
+        self.browser_pool = browser_pool
+        # 拦截器可能被并行的采集共享：不清空其计数，按快照计算本次采集的增量
+        self._blocker_snapshot = self.resource_blocker.snapshot() if self.resource_blocker else None
+        
+        # 详情页优先直接HTTP获取初始HTML解析，正文不足时才用浏览器渲染
+        self.http_first = CRAWLER_CONFIG.get('http_first', True) and BeautifulSoup is not None
+        if not self.http_first:
+            # 详情页全部经浏览器渲染时，同时进行的请求数受页面池大小限制，并发上限不超过池大小
+            self.limiter.max_limit = max(self.limiter.min_limit, min(self.limiter.max_limit, self.browser_pool.size))
+            self.limiter.limit = min(self.limiter.limit, self.limiter.max_limit)
+        self._owns_session = session is None
+        self.session = session
+        self.parse_pool = ParsePool(
+            mode=CRAWLER_CONFIG.get('parse_pool_mode', 'thread'),
+            workers=CRAWLER_CONFIG.get('parse_workers', 2),
+            queue_size=CRAWLER_CONFIG.get('parse_queue_size', 8)
+        )
+        self.detail_stats = {'http': 0, 'browser': 0}
+        
+    async def _ensure_session(self):
+        """确保HTTP会话存在"""
+        if not self.session:
+            self.session = create_session()
+        
+    async def close(self):
+        """关闭自建的HTTP会话和页面池中的浏览器；外部共享的会话与页面池保持打开"""
+        if any(self.detail_stats.values()):
+            self.logger.info(f"详情页获取方式: HTTP {self.detail_stats['http']} 篇，"
+                             f"浏览器 {self.detail_stats['browser']} 篇")
+            self.detail_stats = {'http': 0, 'browser': 0}
+        self.parse_pool.shutdown()
+        if self._owns_session:
+            if self.session and not self.session.closed:
+                await self.session.close()
+            self.session = None
+        if self.browser_pool.stats()['checkouts']:
+            self.logger.info(f"浏览器池统计: {self.browser_pool.stats()}")
+            if self.resource_blocker:
+                self.logger.info(f"资源拦截统计: {self.resource_blocker.stats(since=self._blocker_snapshot)}")
+        if self.resource_blocker:
+            self._blocker_snapshot = self.resource_blocker.snapshot()
+        if self._owns_browser_pool:
+            await self.browser_pool.close()
         
     async def get_article_list(self, start_date: date, end_date: date) -> List[Dict]:
         """获取搜狐腾讯研究院文章列表"""
         articles = []
+        all_found_articles = []  # 用于调试
         
-        async with async_playwright() as p:
-            browser_options = {
-                'headless': True,
-                'args': [
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-web-security',
-                    '--disable-dev-shm-usage',
-                    '--disable-blink-features=AutomationControlled'
-                ]
-            }
-            browser = await p.chromium.launch(**browser_options)
-            page = await browser.new_page()
-            
-            # 设置更真实的User-Agent
-            await page.set_extra_http_headers({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            
+        # 页面上下文已设置真实的User-Agent
+        async with self.browser_pool.page() as page:
+            # 信息流由后台JSON请求加载：读取结构化数据，并与DOM选择器提取的链接合并
+            feed = _FeedCapture()
+            page.on("response", feed.on_response)
+            feed_loaded = None   # 等待信息流XHR静默的任务，与选择器/DOM等待并行
             try:
-                await page.goto(self.base_url, wait_until="domcontentloaded", timeout=30000)
-                await page.wait_for_timeout(2000)  # 等待JavaScript加载，缩短等待时间
+                await page.goto(self.base_url, wait_until="domcontentloaded", timeout=self.deadline.cap_ms(30000))
+                # 等待文章链接渲染出来、DOM稳定且信息流请求加载完成，而不是固定等待
+                feed_loaded = asyncio.ensure_future(self._wait_feed_quiet(page, timeout=5000))
+                await wait_for_any_selector(page, ARTICLE_SELECTORS, timeout=self.deadline.cap_ms(5000))
+                await wait_for_dom_quiet(page, quiet_ms=300, timeout=self.deadline.cap_ms(2000))
+                await feed_loaded
                 
-                # 滚动页面以加载更多内容
-                for _ in range(2):  # 减少滚动次数
+                # 逐次滚动加载：每次只解析新出现的条目，一旦出现早于起始日期的文章或列表不再增长即停止，
+                # 滚动次数随请求的日期范围增减
+                max_scrolls = CRAWLER_CONFIG.get('max_list_scrolls', 30)
+                seen_hrefs = set()
+                seen_articles = set()
+                scrolls = 0
+                while True:
+                    # 每轮都合并JSON条目和DOM链接（一次 evaluate 取回全部候选链接）：捕获到的JSON
+                    # 可能来自无关请求或只覆盖部分条目，不能据此跳过DOM；JSON条目在前，去重时优先保留
+                    items = await feed.drain_items()
+                    items += await page.evaluate(LIST_EXTRACT_JS, ARTICLE_SELECTORS)
+                    new_items = [item for item in items if item.get('href') not in seen_hrefs]
+                    seen_hrefs.update(item.get('href') for item in new_items)
+                    new_articles, new_titles = self._parse_list_items(new_items)
+                    # JSON与DOM中同一文章的链接写法可能不同，按文章ID去重（同一轮内也去重）
+                    unique_articles = []
+                    for article in new_articles:
+                        key = self._article_key(article['url'])
+                        if key not in seen_articles:
+                            seen_articles.add(key)
+                            unique_articles.append(article)
+                    new_articles = unique_articles
+                    articles.extend(new_articles)
+                    all_found_articles.extend(new_titles)
+                    
+                    if any(self._is_before(article.get('date'), start_date) for article in new_articles):
+                        self.logger.info(f"滚动 {scrolls} 次后已出现早于 {start_date} 的文章，停止加载")
+                        break
+                    if scrolls >= max_scrolls:
+                        self.logger.warning(f"已滚动 {max_scrolls} 次仍未到达 {start_date}，停止加载")
+                        break
+                    if self.deadline.expired():
+                        self.partial = True
+                        self.logger.warning(f"滚动 {scrolls} 次后已到达截止时间，只使用已加载的列表")
+                        break
+                    
+                    height = await page.evaluate("document.body.scrollHeight")
+                    # 滚动前开始监听，不漏掉滚动触发的信息流请求
+                    feed_loaded = asyncio.ensure_future(self._wait_feed_quiet(page, timeout=3000))
                     await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await page.wait_for_timeout(1000)  # 缩短等待时间
-                
-                # 更精确的选择器定位文章 - 增加更多可能的选择器
-                article_selectors = [
-                    "div.feed-item-content a",
-                    "div[class*='item'] a[href*='/a/']",
-                    ".article-item a",
-                    "a[href*='/a/'][title]",
-                    "div.list-item a",
-                    "article a",
-                    ".content-list a",
-                    "[class*='article'] a",
-                    "[class*='news'] a",
-                    "a[href*='sohu.com/a/']",
-                    "h3 a",
-                    "h4 a",
-                    ".title a"
-                ]
-                
-                found_links = set()
-                all_found_articles = []  # 用于调试
-                
-                for selector in article_selectors:
-                    try:
-                        links = await page.query_selector_all(selector)
-                        self.logger.debug(f"选择器 {selector} 找到 {len(links)} 个链接")
-                        for link in links:
-                            href = await link.get_attribute('href')
-                            if href and href not in found_links:
-                                found_links.add(href)
-                                
-                                # 获取标题
-                                title = await link.get_attribute('title') or await link.text_content()
-                                if not title:
-                                    continue
-                                
-                                # 记录所有找到的文章标题用于调试
-                                all_found_articles.append(title.strip())
-                                    
-                                # 只处理标题包含"腾讯研究院AI速递"的文章
-                                if "腾讯研究院AI速递" not in title:
-                                    continue
-                                
-                                self.logger.info(f"找到匹配文章: {title.strip()}")
-                                    
-                                # 确保是完整的URL
-                                if href.startswith('/'):
-                                    href = "https://m.sohu.com" + href
-                                elif not href.startswith('http'):
-                                    href = "https://m.sohu.com/" + href
-                                
-                                # 尝试获取日期
-                                parent = await link.evaluate_handle("el => el.parentElement")
-                                date_text = ""
-                                if parent:
-                                    date_elem = await parent.query_selector("[class*='time'], [class*='date'], span")
-                                    if date_elem:
-                                        date_text = await date_elem.text_content()
-                                
-                                # 优先从标题中提取日期（腾讯研究院AI速递通常在标题中包含日期）
-                                article_date = self._extract_date_from_title(title) or self._extract_date_from_text(date_text)
-                                
-                                articles.append({
-                                    'title': title.strip(),
-                                    'url': href,
-                                    'date': article_date,
-                                    'source': '腾讯研究院AI速递',
-                                    'weight': self.source_weight
-                                })
-                    except Exception as e:
-                        self.logger.debug(f"选择器 {selector} 处理失败: {e}")
-                        continue
+                    scrolls += 1
+                    # 新内容追加后页面变高，再等DOM稳定和信息流请求完成；没有更多内容时最多等待超时
+                    if not await wait_for_growth(page, "document.body.scrollHeight", height,
+                                                 timeout=self.deadline.cap_ms(3000)):
+                        self.logger.info(f"滚动 {scrolls} 次后列表不再增长，停止加载")
+                        break
+                    await wait_for_dom_quiet(page, quiet_ms=200, timeout=self.deadline.cap_ms(1000))
+                    await feed_loaded
                         
             except Exception as e:
                 self.logger.error(f"获取搜狐文章列表失败: {e}")
-                
             finally:
-                await browser.close()
+                # 未完成的网络静默等待会在结束时移除其页面监听，页面归还前先等它退出
+                if feed_loaded and not feed_loaded.done():
+                    feed_loaded.cancel()
+                    await asyncio.gather(feed_loaded, return_exceptions=True)
+                # 页面会归还到池中复用，移除本次的监听
+                page.remove_listener("response", feed.on_response)
+            self.logger.info(f"列表共 {len(articles)} 篇，其中捕获的信息流JSON条目 {feed.feed_items} 条")
                 
         # 调试信息：输出所有找到的文章标题
         if all_found_articles:
@@ -141,121 +462,169 @@ class SohuScraper(BaseScraper):
         self.logger.info(f"找到 {len(articles)} 篇文章，过滤后 {len(filtered_articles)} 篇在指定日期范围内")
         return filtered_articles
         
+    async def _wait_feed_quiet(self, page, timeout: int) -> bool:
+        """等待信息流XHR/fetch请求全部完成（最长 timeout 毫秒，不超过截止时间）"""
+        return await wait_for_network_quiet(page, quiet_ms=200, timeout=self.deadline.cap_ms(timeout),
+                                            resource_types=('xhr', 'fetch'))
+        
+    @staticmethod
+    def _article_key(url: str) -> str:
+        """文章唯一键：搜狐文章链接中的 /a/<ID>，没有时使用完整链接"""
+        match = re.search(r'/a/(\d+)', url)
+        return match.group(1) if match else url
+        
+    def _is_before(self, article_date: str, start_date: date) -> bool:
+        """文章日期是否早于起始日期（日期缺失或无法解析时返回False）"""
+        if not article_date:
+            return False
+        return self.is_date_in_range(article_date, date.min, start_date - timedelta(days=1))
+        
+    def _parse_list_items(self, items: List[Dict]) -> Tuple[List[Dict], List[str]]:
+        """
+        把页面内提取的候选链接转换为文章列表
+        Args:
+            items: [{'href', 'title', 'dateText'}]，已按href去重
+        Returns:
+            (标题包含"腾讯研究院AI速递"的文章列表, 所有找到的标题（用于调试）)
+        """
+        articles = []
+        all_titles = []
+        for item in items:
+            href = item.get('href')
+            title = item.get('title')
+            if not href or not title:
+                continue
+            
+            # 记录所有找到的文章标题用于调试
+            all_titles.append(title.strip())
+            
+            # 只处理标题包含"腾讯研究院AI速递"的文章
+            if "腾讯研究院AI速递" not in title:
+                continue
+            
+            self.logger.info(f"找到匹配文章: {title.strip()}")
+            
+            # 确保是完整的URL
+            if href.startswith('/'):
+                href = "https://m.sohu.com" + href
+            elif not href.startswith('http'):
+                href = "https://m.sohu.com/" + href
+            
+            # 优先从标题中提取日期（腾讯研究院AI速递通常在标题中包含日期）
+            article_date = self._extract_date_from_title(title) or self._extract_date_from_text(item.get('dateText', ''))
+            
+            articles.append({
+                'title': title.strip(),
+                'url': href,
+                'date': article_date,
+                'source': '腾讯研究院AI速递',
+                'weight': self.source_weight
+            })
+        return articles, all_titles
+        
     async def get_article_detail(self, article_url: str, list_date: str = "") -> Optional[Article]:
-        """获取文章详细内容"""
+        """获取文章详细内容：先直接HTTP获取并解析，正文不足时退回浏览器渲染"""
         if not article_url:
             return None
-            
-        async with async_playwright() as p:
-            browser_options = {
-                'headless': True,
-                'args': [
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-web-security',
-                    '--disable-dev-shm-usage'
-                ]
-            }
-            browser = await p.chromium.launch(**browser_options)
-            page = await browser.new_page()
-            
+        
+        if self.http_first:
+            article = await self._get_article_detail_http(article_url, list_date)
+            if article:
+                self.detail_stats['http'] += 1
+                return article
+        
+        article = await self._get_article_detail_browser(article_url, list_date)
+        if article:
+            self.detail_stats['browser'] += 1
+        return article
+    
+    async def _get_article_detail_http(self, article_url: str, list_date: str = "") -> Optional[Article]:
+        """
+        HTTP快速路径：搜狐文章正文直接包含在初始HTML中，无需浏览器渲染
+        Returns:
+            文章对象；请求失败或正文未超过 MIN_CONTENT_LENGTH 时返回None（由调用方退回浏览器）
+        """
+        try:
+            await self._ensure_session()
+            timeout = aiohttp.ClientTimeout(total=self.deadline.cap(CRAWLER_CONFIG.get('request_timeout', 30)), connect=5)
+            async with self.session.get(article_url, timeout=timeout) as response:
+                # 状态码登记到限流器跟踪的请求上，429/5xx 时降低并发
+                request = current_request()
+                if request:
+                    request.status = response.status
+                if response.status != 200:
+                    self.logger.debug(f"HTTP获取 {article_url} 返回 {response.status}，改用浏览器")
+                    return None
+                html = await response.text()
+            title, content, date_texts = await self.parse_pool.run(parse_article_html, html)
+        except Exception as e:
+            self._record_timeout(e)
+            self.logger.debug(f"HTTP获取文章失败 {article_url}: {e}，改用浏览器")
+            return None
+        
+        if not title or not title.strip() or not content or len(content.strip()) <= MIN_CONTENT_LENGTH:
+            self.logger.debug(f"HTTP解析 {article_url} 正文不足，改用浏览器")
+            return None
+        return self._build_article(article_url, list_date, title, content, date_texts)
+    
+    def _build_article(self, article_url: str, list_date: str, title: str, content: str,
+                       date_texts: List[str]) -> Article:
+        """由提取出的标题、正文和日期文本构造文章对象"""
+        article_date = ""
+        for date_text in date_texts:
+            article_date = self._extract_date_from_text(date_text)
+            if article_date:
+                break
+        
+        # 优先使用列表页日期，其次使用详情页日期，最后才使用今天
+        final_date = list_date or article_date or date.today().strftime("%Y-%m-%d")
+        return Article(
+            title=title.strip(),
+            date=final_date,
+            content=content.strip(),
+            url=article_url
+        )
+    
+    async def _get_article_detail_browser(self, article_url: str, list_date: str = "") -> Optional[Article]:
+        """浏览器渲染路径：初始HTML中没有正文时使用"""
+        request = current_request()
+        checkout_started = time.perf_counter()
+        async with self.browser_pool.page() as page:
+            # 排队借用页面（及首次启动浏览器）的时间不计入限流器的请求延迟
+            if request:
+                request.exclude(time.perf_counter() - checkout_started)
             try:
-                await page.goto(article_url, wait_until="domcontentloaded", timeout=20000)
-                await page.wait_for_timeout(1000)  # 缩短等待时间
-                
-                # 获取文章标题
-                title_selectors = [
-                    "h1",
-                    "[class*='title']",
-                    ".article-title",
-                    ".content-title"
-                ]
-                
-                title = ""
-                for selector in title_selectors:
-                    try:
-                        title_element = await page.query_selector(selector)
-                        if title_element:
-                            title = await title_element.text_content()
-                            if title and title.strip():
-                                break
-                    except:
-                        continue
-                        
-                # 获取文章内容 - 针对搜狐页面结构优化
-                content_selectors = [
-                    ".text",  # 搜狐文章主要内容
-                    "[class*='content']",
-                    "[class*='article-body']",
-                    ".article-content",
-                    "article",
-                    "[id*='content']",
-                    ".text-content",  # 搜狐可能的内容区域
-                ]
+                await page.goto(article_url, wait_until="domcontentloaded", timeout=self.deadline.cap_ms(20000))
+                # 正文容器出现且DOM稳定即可提取
+                await wait_for_any_selector(page, CONTENT_SELECTORS, timeout=self.deadline.cap_ms(5000))
+                await wait_for_dom_quiet(page, quiet_ms=200, timeout=self.deadline.cap_ms(1500))
                 
-                content = ""
-                for selector in content_selectors:
-                    try:
-                        content_element = await page.query_selector(selector)
-                        if content_element:
-                            # 获取纯文本内容，但保持段落结构
-                            paragraphs = await content_element.query_selector_all("p, div")
-                            if paragraphs:
-                                content_parts = []
-                                for p in paragraphs:
-                                    p_text = await p.text_content()
-                                    if p_text and p_text.strip() and len(p_text.strip()) > 10:
-                                        content_parts.append(p_text.strip())
-                                content = "\n\n".join(content_parts)
-                            else:
-                                content = await content_element.text_content()
-                            
-                            if content and len(content.strip()) > 100:  # 确保获取到有意义的内容
-                                break
-                    except:
-                        continue
-                        
-                # 获取发布日期
-                date_selectors = [
-                    "[class*='time']",
-                    "[class*='date']",
-                    ".publish-time",
-                    ".article-date"
-                ]
-                
-                article_date = ""
-                for selector in date_selectors:
-                    try:
-                        date_element = await page.query_selector(selector)
-                        if date_element:
-                            date_text = await date_element.text_content()
-                            if date_text:
-                                article_date = self._extract_date_from_text(date_text)
-                                if article_date:
-                                    break
-                    except:
-                        continue
+                # 一次 evaluate 取回标题、正文和日期文本
+                extracted = await page.evaluate(DETAIL_EXTRACT_JS, {
+                    'titleSelectors': TITLE_SELECTORS,
+                    'contentSelectors': CONTENT_SELECTORS,
+                    'dateSelectors': DATE_SELECTORS,
+                    'minLength': MIN_CONTENT_LENGTH
+                })
+                title, content = extracted['title'], extracted['content']
                         
                 if not title or not content:
                     self.logger.warning(f"无法从 {article_url} 获取完整文章信息")
                     return None
-                    
-                # 优先使用列表页日期，其次使用详情页日期，最后才使用今天
-                final_date = list_date or article_date or date.today().strftime("%Y-%m-%d")
                 
-                return Article(
-                    title=title.strip(),
-                    date=final_date,
-                    content=content.strip(),
-                    url=article_url
-                )
+                return self._build_article(article_url, list_date, title, content, extracted['dateTexts'])
                 
             except Exception as e:
+                self._record_timeout(e)
                 self.logger.error(f"获取文章详情失败 {article_url}: {e}")
                 return None
-                
-            finally:
-                await browser.close()
+    
+    @staticmethod
+    def _record_timeout(error: Exception):
+        """详情页方法内部捕获了异常，超时需登记到限流器跟踪的请求上才会降低并发"""
+        request = current_request()
+        if request and 'timeout' in type(error).__name__.lower():
+            request.congestion = 'timeout'
                 
     def _extract_date_from_text(self, text: str) -> str:
         """从文本中提取日期，处理相对时间"""
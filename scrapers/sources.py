@@ -0,0 +1,210 @@
+"""
+数据源注册表
+每个数据源注册一个采集协程，/api/crawl 在同一个事件循环上并发运行所有选中的数据源，
+各数据源通过自己的进度通道汇报进度，总耗时约为最慢数据源的耗时
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .sohu_scraper import SohuScraper, create_browser_pool, create_session as create_sohu_session
+from .aibase_news_scraper import AIBaseNewsScraper, create_session as create_aibase_session
+from .deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+# 数据源自身会在截止时间到达时收尾返回；超过截止时间这么多秒仍未返回时强制取消
+DEADLINE_GRACE = 5
+
+
+class ProgressLane:
+    """单个数据源的进度通道"""
+
+    def __init__(self, key: str, label: str, on_update: Optional[Callable[['ProgressLane'], None]] = None):
+        self.key = key
+        self.label = label
+        self.status = 'pending'
+        self.message = ''
+        self.current = 0
+        self.total = 0
+        self.count = 0
+        self.partial = False
+        self.details: List[str] = []
+        self._on_update = on_update
+
+    def update(self, message: str = None, current: int = None, total: int = None, status: str = None):
+        """更新进度并通知订阅方"""
+        if message is not None:
+            self.message = message
+        if current is not None:
+            self.current = current
+        if total is not None:
+            self.total = total
+        if status is not None:
+            self.status = status
+        if self._on_update:
+            self._on_update(self)
+
+    def fraction(self) -> float:
+        """完成比例（0~1）"""
+        if self.status in ('completed', 'error'):
+            return 1.0
+        return self.current / self.total if self.total else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            'label': self.label,
+            'status': self.status,
+            'message': self.message,
+            'current': self.current,
+            'total': self.total,
+            'count': self.count,
+            'partial': self.partial,
+            'details': list(self.details),
+        }
+
+
+class SourceSpec:
+    """已注册的数据源"""
+
+    def __init__(self, key: str, label: str,
+                 crawl: Callable[[str, ProgressLane, Deadline, Any], Awaitable[List[Dict]]]):
+        self.key = key
+        self.label = label
+        self.crawl = crawl
+
+
+# 数据源键 -> SourceSpec，按注册顺序排列（也是结果合并顺序）
+SOURCES: Dict[str, SourceSpec] = {}
+
+
+def register_source(key: str, label: str):
+    """
+    注册数据源的装饰器，被装饰的协程签名为
+    crawl(目标日期 YYYY-MM-DD, 进度通道, 截止时间, 共享客户端或None) -> 文章字典列表
+    截止时间到达时数据源应取消未完成的工作，返回已获取的部分并把进度通道的 partial 置为True
+    """
+    def decorator(func):
+        SOURCES[key] = SourceSpec(key, label, func)
+        return func
+    return decorator
+
+
+def register_shared_clients(service):
+    """
+    在常驻事件循环服务（AsyncLoopService）上注册数据源共用的长连接资源，
+    之后每次采集都复用同一个HTTP连接池和已启动的浏览器
+    """
+    service.register_client('sohu_session', create_sohu_session, close=lambda session: session.close())
+    # 页面池与安装在其上的资源拦截器一起注册，采集结束时据此输出拦截统计
+    service.register_client('sohu_browser_pool', create_browser_pool,
+                            close=lambda pool_and_blocker: pool_and_blocker[0].close())
+    service.register_client('aibase_session', create_aibase_session, close=lambda session: session.close())
+
+
+@register_source('tencent', '腾讯研究院')
+async def crawl_tencent(target_date: str, lane: ProgressLane, deadline: Deadline, clients=None) -> List[Dict]:
+    """爬取腾讯研究院AI速递"""
+    lane.update("正在爬取腾讯研究院AI速递...")
+    if clients:
+        browser_pool, resource_blocker = await clients.client('sohu_browser_pool')
+        scraper = SohuScraper(browser_pool=browser_pool,
+                              session=await clients.client('sohu_session'),
+                              resource_blocker=resource_blocker)
+    else:
+        scraper = SohuScraper()
+    target_date_obj = datetime.strptime(target_date, '%Y-%m-%d').date()
+    articles, errors = await scraper.scrape_articles(
+        target_date_obj, target_date_obj,
+        progress_callback=lambda message, current, total: lane.update(message, current, total),
+        deadline=deadline
+    )
+    lane.partial = scraper.partial
+    lane.count = len(articles)
+    lane.details.append(f"腾讯研究院: 成功获取 {len(articles)} 篇文章")
+    if errors:
+        lane.details.extend([f"腾讯研究院错误: {error}" for error in errors[:3]])
+    return [article.to_dict() for article in articles]
+
+
+@register_source('aibase', 'AIBase快讯')
+async def crawl_aibase(target_date: str, lane: ProgressLane, deadline: Deadline, clients=None) -> List[Dict]:
+    """爬取AIBase快讯（采集前一天的数据，因为AIBase当天快讯对应前一天信息）"""
+    scraper = AIBaseNewsScraper(session=await clients.client('aibase_session') if clients else None)
+    aibase_date = (datetime.strptime(target_date, '%Y-%m-%d') - timedelta(days=1)).strftime('%Y-%m-%d')
+    lane.details.append(f"AIBase采集日期: {aibase_date} (前一天，因为AIBase快讯时效对应前一天信息)")
+    lane.update("正在爬取AIBase快讯...")
+
+    # 流式采集：每确认一条即更新进度，不必等整个采集结束
+    streamed = []
+    async for news in scraper.iter_news_by_date(aibase_date, deadline=deadline):
+        streamed.append(news)
+        lane.count = len(streamed)
+        lane.update(f"正在爬取AIBase快讯... 已获取 {len(streamed)} 条")
+    news_list = sorted(streamed, key=lambda x: x['id'], reverse=True)
+    lane.partial = scraper.partial
+
+    # 转换为Article格式
+    articles = [{
+        'title': news.get('title', ''),
+        'date': news.get('date', target_date),
+        'content': news.get('content', news.get('summary', '')),
+        'url': news.get('url', ''),
+        'source': news.get('source', 'AIBase快讯'),
+        'weight': news.get('weight', 5)
+    } for news in news_list]
+    lane.details.append(f"AIBase快讯: 成功获取 {len(news_list)} 条快讯")
+    return articles
+
+
+async def crawl_sources(keys: Iterable[str], target_date: str,
+                        on_update: Optional[Callable[[ProgressLane], None]] = None,
+                        deadline=None, clients=None) -> Tuple[List[Dict], Dict[str, ProgressLane]]:
+    """
+    在当前事件循环上并发爬取所有选中的数据源
+    Args:
+        keys: 数据源键列表（如 ['tencent', 'aibase']）
+        target_date: 目标日期 (YYYY-MM-DD)
+        on_update: 任一进度通道更新时的回调
+        deadline: 所有数据源共享的截止时间（Deadline或秒数），None 表示不限时；
+                  到期的数据源返回已获取的部分，其进度通道 partial 为True
+        clients: 提供共享长连接资源的服务（见 register_shared_clients），None 时每次采集自建并关闭
+    Returns:
+        (按注册顺序合并的文章字典列表, {数据源键: 进度通道})
+    """
+    deadline = Deadline.coerce(deadline)
+    selected = set(keys)
+    for key in selected - set(SOURCES):
+        logger.warning(f"未知数据源: {key}")
+    lanes = {
+        key: ProgressLane(key, spec.label, on_update)
+        for key, spec in SOURCES.items() if key in selected
+    }
+
+    async def run(key: str) -> List[Dict]:
+        lane = lanes[key]
+        lane.update(status='running')
+        remaining = deadline.remaining()
+        try:
+            articles = await asyncio.wait_for(
+                SOURCES[key].crawl(target_date, lane, deadline, clients),
+                None if remaining is None else remaining + DEADLINE_GRACE
+            )
+            suffix = "（已到截止时间，结果不完整）" if lane.partial else ""
+            lane.update(f"{lane.label}: 完成，共 {len(articles)} 篇{suffix}", status='completed')
+            return articles
+        except asyncio.TimeoutError:
+            logger.error(f"{lane.label} 超过截止时间仍未结束，已强制取消")
+            lane.partial = True
+            lane.details.append(f"{lane.label}: 超过截止时间，已取消")
+            lane.update(f"{lane.label}: 已取消", status='error')
+            return []
+        except Exception as e:
+            logger.error(f"{lane.label} 爬取失败: {e}")
+            lane.details.append(f"{lane.label}爬取失败: {str(e)}")
+            lane.update(f"{lane.label}: 失败", status='error')
+            return []
+
+    results = await asyncio.gather(*(run(key) for key in lanes))
+    return [article for articles in results for article in articles], lanes